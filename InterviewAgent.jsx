@@ -15,6 +15,7 @@ const InterviewAgent = () => {
   const [isExtractingSkills, setIsExtractingSkills] = useState(false);
 
   // Interview flow
+  const [sessionId, setSessionId] = useState(null); // returned by the API, sent back on every call
   const [interviewStarted, setInterviewStarted] = useState(false);
   const [currentQuestionNo, setCurrentQuestionNo] = useState(0);
   const [currentQuestion, setCurrentQuestion] = useState("");
@@ -32,67 +33,53 @@ const InterviewAgent = () => {
   // --------- Helpers ---------
   const isJobReady = candidateName.trim() && jobRole.trim() && skills.trim();
 
-  // TODO: Replace with real API call for resume skill extraction
   const handleExtractSkills = async () => {
     if (!resumeFile) return;
     setIsExtractingSkills(true);
     setError("");
 
     try {
-      // Example real call:
-      // const formData = new FormData();
-      // formData.append("resume", resumeFile);
-      // const res = await fetch("/api/interview/extract-skills", {
-      //   method: "POST",
-      //   body: formData,
-      // });
-      // const data = await res.json();
-      // setSkills(data.skills);
-
-      // TEMP demo placeholder
-      setTimeout(() => {
-        setSkills("Python, SQL, Data Structures, OOP, HTML, CSS, JavaScript");
-        setIsExtractingSkills(false);
-      }, 800);
+      const formData = new FormData();
+      formData.append("resume", resumeFile);
+      const res = await fetch("/api/interview/extract-skills", {
+        method: "POST",
+        body: formData,
+      });
+      const data = await res.json();
+      if (!res.ok) throw new Error(data.error);
+      setSkills(data.skills);
     } catch (e) {
       setError("Failed to extract skills. Please try again.");
+    } finally {
       setIsExtractingSkills(false);
     }
   };
 
-  // TODO: Replace with real backend call to fetch next question
-  const fetchNextQuestion = async (questionNo) => {
+  // session is passed explicitly when starting over, before setSessionId(null) has applied
+  const fetchNextQuestion = async (questionNo, session = sessionId) => {
     setIsLoadingQuestion(true);
     setError("");
     setCurrentAnswer("");
 
     try {
-      // Example real call:
-      // const res = await fetch("/api/interview/next-question", {
-      //   method: "POST",
-      //   headers: { "Content-Type": "application/json" },
-      //   body: JSON.stringify({
-      //     candidateName,
-      //     jobRole,
-      //     experienceLevel,
-      //     interviewType,
-      //     skills,
-      //     questionNo,
-      //   }),
-      // });
-      // const data = await res.json();
-      // setCurrentQuestion(data.question);
-
-      // TEMP demo questions
-      const demoQuestions = [
-        "Tell me about a project where you used Python to solve a real-world problem.",
-        "How do you approach debugging and troubleshooting in your code?",
-        "Describe a situation where you worked with a dataset and identified patterns.",
-        "What is the difference between a list and a tuple in Python?",
-        "Describe a time you worked in a team and handled a conflict or challenge.",
-      ];
-      const index = (questionNo - 1) % demoQuestions.length;
-      setCurrentQuestion(demoQuestions[index]);
+      const res = await fetch("/api/interview/next-question", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({
+          sessionId: session,
+          candidateName,
+          jobRole,
+          experienceLevel,
+          interviewType,
+          skills,
+          questionNo,
+          numQuestions,
+        }),
+      });
+      const data = await res.json();
+      if (!res.ok) throw new Error(data.error);
+      setSessionId(data.sessionId);
+      setCurrentQuestion(data.question);
       setCurrentQuestionNo(questionNo);
     } catch (e) {
       setError("Failed to fetch question. Please try again.");
@@ -107,12 +94,13 @@ const InterviewAgent = () => {
       return;
     }
     setError("");
+    setSessionId(null);
     setInterviewStarted(true);
     setQaHistory([]);
     setFinalReport("");
     setScoresTable([]);
     setAverageScore(null);
-    await fetchNextQuestion(1);
+    await fetchNextQuestion(1, null);
   };
 
   const handleSaveAnswerAndNext = async () => {
@@ -158,7 +146,6 @@ const InterviewAgent = () => {
     }
   };
 
-  // TODO: Replace with real backend call to evaluate all answers & generate report
   const handleSubmitAndGenerateReport = async () => {
     if (qaHistory.length === 0) {
       setError("No answers recorded. Please answer at least one question.");
@@ -169,43 +156,25 @@ const InterviewAgent = () => {
     setError("");
 
     try {
-      // Example real call:
-      // const res = await fetch("/api/interview/generate-report", {
-      //   method: "POST",
-      //   headers: { "Content-Type": "application/json" },
-      //   body: JSON.stringify({
-      //     candidateName,
-      //     jobRole,
-      //     experienceLevel,
-      //     interviewType,
-      //     skills,
-      //     qaHistory,
-      //   }),
-      // });
-      // const data = await res.json();
-      // setScoresTable(data.scores);
-      // setAverageScore(data.averageScore);
-      // setFinalReport(data.report);
-
-      // TEMP: fake scoring & report
-      const demoScores = qaHistory.map((item) => ({
-        questionNo: item.questionNo,
-        score: item.answer === "(Skipped)" ? -1 : 8,
-        answered: item.answer === "(Skipped)" ? "Skipped" : "Yes",
-      }));
-      const validScores = demoScores.filter((s) => s.score >= 0).map((s) => s.score);
-      const avg =
-        validScores.length > 0
-          ? validScores.reduce((a, b) => a + b, 0) / validScores.length
-          : null;
-
-      setScoresTable(demoScores);
-      setAverageScore(avg);
-      setFinalReport(
-        `Overall, ${candidateName || "the candidate"} shows strong fundamentals for the role of ${
-          jobRole || "the position"
-        }.\n\nKey strengths include communication, clarity of thought, and relevant technical knowledge.\nSome answers could be more structured and include concrete examples, but overall performance is promising.\n\nRecommendation: Suitable for an internship / entry-level opportunity with guidance and mentorship.`
-      );
+      const res = await fetch("/api/interview/generate-report", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({
+          sessionId,
+          candidateName,
+          jobRole,
+          experienceLevel,
+          interviewType,
+          skills,
+          qaHistory,
+        }),
+      });
+      const data = await res.json();
+      if (!res.ok) throw new Error(data.error);
+      setSessionId(data.sessionId);
+      setScoresTable(data.scores);
+      setAverageScore(data.averageScore);
+      setFinalReport(data.report);
     } catch (e) {
       setError("Failed to generate report. Please try again.");
     } finally {
@@ -214,6 +183,7 @@ const InterviewAgent = () => {
   };
 
   const handleReset = () => {
+    setSessionId(null);
     setInterviewStarted(false);
     setCurrentQuestionNo(0);
     setCurrentQuestion("");
@@ -0,0 +1,302 @@
+"""
+Headless HTTP API for the interview agent (backs InterviewAgent.jsx).
+
+Run with:
+    uvicorn api:app --host 0.0.0.0 --port 8000 --workers 2
+
+Blocking model calls run on a dedicated thread pool, so one worker process
+can serve many interviews at the same time.
+"""
+import asyncio
+import contextvars
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import List, Optional
+
+from fastapi import FastAPI, File, UploadFile
+from fastapi.responses import JSONResponse, PlainTextResponse
+from pydantic import BaseModel, Field, field_validator
+
+from history import HistoryItem, spill
+from interview import (
+    EVAL_BATCH_MODE,
+    QUESTION_PLAN_MODE,
+    QuestionPrefetcher,
+    evaluate_history,
+    evaluate_history_batch,
+    generate_summary,
+)
+from interview_store import get_store
+from llm_transport import (
+    LLMCircuitOpenError,
+    LLMError,
+    LLMRateLimitError,
+    LLMTimeoutError,
+)
+from question_bank import get_bank
+from resume import resume_skills
+from session_state import StaleSessionError, get_backend
+from telemetry import current_session, telemetry
+
+# ---------- Config ----------
+API_LLM_THREADS = int(os.getenv("API_LLM_THREADS", "64"))
+API_SESSION_TTL_SECONDS = float(os.getenv("API_SESSION_TTL_SECONDS", "7200"))
+
+_llm_pool = ThreadPoolExecutor(max_workers=API_LLM_THREADS, thread_name_prefix="api-llm")
+
+
+async def run_blocking(fn, *args, **kwargs):
+    """
+    Runs a blocking helper on the model thread pool without blocking the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()  # keeps the telemetry session tag
+    return await loop.run_in_executor(_llm_pool, partial(ctx.run, fn, *args, **kwargs))
+
+
+# ---------- Server-side session store ----------
+class InterviewSession:
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.history = []  # list of history.HistoryItem, like st.session_state.history
+        self.questions = {}  # question_no -> question text served by next-question
+        self.version = 0  # session backend version this state was loaded at
+        self.prefetcher = QuestionPrefetcher()
+        self.touched_at = time.monotonic()
+
+
+class SessionStore:
+    """
+    Interview sessions of this worker process, expired after
+    API_SESSION_TTL_SECONDS of inactivity. History and questions live in the
+    session backend (session_state.py), so with SESSION_BACKEND=sqlite any
+    worker can serve any session; only the prefetcher is per process.
+    """
+
+    def __init__(self, ttl_seconds: float = API_SESSION_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._sessions = {}
+
+    def get(self, session_id: Optional[str]) -> InterviewSession:
+        self._expire()
+        session = self._sessions.get(session_id) if session_id else None
+        if session is None:
+            session = InterviewSession(session_id or uuid.uuid4().hex)
+            self._sessions[session.session_id] = session
+        session.touched_at = time.monotonic()
+
+        state, version = get_backend().load(session.session_id)
+        if state is not None and version != session.version:
+            session.history = [HistoryItem.from_dict(item) for item in state["history"]]
+            session.questions = {int(k): v for k, v in state["questions"].items()}
+            session.version = version
+        return session
+
+    def save(self, session: InterviewSession) -> None:
+        """
+        Writes the session back; raises StaleSessionError if another request
+        changed it since it was loaded.
+        """
+        session.version = get_backend().save(
+            session.session_id,
+            {"history": [item.to_dict() for item in session.history], "questions": session.questions},
+            session.version,
+        )
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self.ttl_seconds
+        for session_id in [k for k, s in self._sessions.items() if s.touched_at < cutoff]:
+            self._sessions.pop(session_id).prefetcher.clear()
+
+
+sessions = SessionStore()
+
+# ---------- Request / response models ----------
+class JobInfo(BaseModel):
+    sessionId: Optional[str] = None
+    candidateName: str = ""
+    jobRole: str
+    experienceLevel: str = "Fresher"
+    interviewType: str = "Mixed"
+    skills: str
+
+
+class NextQuestionRequest(JobInfo):
+    questionNo: int = Field(ge=1)
+    numQuestions: Optional[int] = None
+    planQuestions: bool = QUESTION_PLAN_MODE
+    regenerate: bool = False
+
+
+class QAItem(BaseModel):
+    questionNo: int
+    question: str
+    answer: str
+
+
+class ReportRequest(JobInfo):
+    qaHistory: Optional[List[QAItem]] = None
+    batchEvaluation: bool = EVAL_BATCH_MODE
+
+    @field_validator("qaHistory")
+    @classmethod
+    def unique_question_numbers(cls, items):
+        numbers = [item.questionNo for item in items or ()]
+        duplicates = sorted({n for n in numbers if numbers.count(n) > 1})
+        if duplicates:
+            raise ValueError(f"questionNo must be unique, repeated: {duplicates}")
+        return items
+
+
+# ---------- App ----------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await run_blocking(get_bank)  # load the question bank before the first request
+    yield
+
+
+app = FastAPI(title="AI Interview Agent API", lifespan=lifespan)
+
+
+@app.exception_handler(LLMError)
+async def llm_error_handler(request, exc: LLMError):
+    status = 502
+    headers = {}
+    if isinstance(exc, (LLMCircuitOpenError, LLMRateLimitError)):
+        status = 503
+        retry_after = getattr(exc, "retry_after", None)
+        if retry_after:
+            headers["Retry-After"] = str(int(retry_after) + 1)
+    elif isinstance(exc, LLMTimeoutError):
+        status = 504
+    return JSONResponse({"error": str(exc)}, status_code=status, headers=headers)
+
+
+@app.exception_handler(StaleSessionError)
+async def stale_session_handler(request, exc: StaleSessionError):
+    return JSONResponse(
+        {"error": "This session was changed by another request. Please retry."},
+        status_code=409,
+    )
+
+
+@app.post("/api/interview/extract-skills")
+async def extract_skills(resume: UploadFile = File(...)):
+    data = await resume.read()
+    skills = await run_blocking(resume_skills, data, resume.filename or "resume.txt")
+    return {"skills": skills}
+
+
+@app.post("/api/interview/next-question")
+async def next_question(req: NextQuestionRequest):
+    session = sessions.get(req.sessionId)
+    current_session.set(session.session_id)
+    inputs = dict(
+        role=req.jobRole,
+        experience=req.experienceLevel,
+        skills=req.skills,
+        interview_type=req.interviewType,
+    )
+    if req.planQuestions and req.numQuestions:
+        session.prefetcher.plan(**inputs, num_questions=req.numQuestions)
+    fetch = session.prefetcher.regenerate if req.regenerate else session.prefetcher.get
+    question = await run_blocking(fetch, **inputs, question_no=req.questionNo)
+    session.questions[req.questionNo] = question
+    await run_blocking(sessions.save, session)
+
+    # Start on the following question while this one is being answered
+    if req.numQuestions is None or req.questionNo < req.numQuestions:
+        session.prefetcher.prefetch(**inputs, question_no=req.questionNo + 1)
+
+    return {"sessionId": session.session_id, "questionNo": req.questionNo, "question": question}
+
+
+@app.post("/api/interview/generate-report")
+async def generate_report(req: ReportRequest):
+    session = sessions.get(req.sessionId)
+    current_session.set(session.session_id)
+    if req.qaHistory is not None:
+        # Answers to questions this session served must carry that question
+        unserved = [
+            item.questionNo
+            for item in req.qaHistory
+            if session.questions and session.questions.get(item.questionNo) != item.question
+        ]
+        if unserved:
+            return JSONResponse(
+                {"error": f"Questions {unserved} do not match the questions served in this session."},
+                status_code=422,
+            )
+        session.history = [
+            HistoryItem(item.questionNo, item.question, item.answer) for item in req.qaHistory
+        ]
+    if not session.history:
+        return JSONResponse(
+            {"error": "No answers recorded. Please answer at least one question."},
+            status_code=400,
+        )
+
+    evaluate = evaluate_history_batch if req.batchEvaluation else evaluate_history
+    await run_blocking(
+        evaluate,
+        session.history,
+        role=req.jobRole,
+        experience=req.experienceLevel,
+        skills=req.skills,
+    )
+    report = await run_blocking(
+        generate_summary,
+        candidate_name=req.candidateName,
+        role=req.jobRole,
+        experience=req.experienceLevel,
+        skills=req.skills,
+        history=session.history,
+    )
+
+    scores = [
+        {
+            "questionNo": item.question_no,
+            "score": item.score,
+            "answered": "Skipped" if item.skipped else "Yes",
+            "evaluation": item.evaluation,
+        }
+        for item in session.history
+    ]
+    valid_scores = [item.score for item in session.history if item.score >= 0]
+    average = sum(valid_scores) / len(valid_scores) if valid_scores else None
+
+    store = get_store()
+    if store is not None:
+        await run_blocking(
+            store.save_interview,
+            candidate_name=req.candidateName,
+            role=req.jobRole,
+            experience=req.experienceLevel,
+            interview_type=req.interviewType,
+            skills=req.skills,
+            history=session.history,
+            summary=report,
+            source_id=session.session_id,
+            replace=True,  # generating the report again updates the stored interview
+        )
+    # Finished: only scores stay in memory, the text goes to disk
+    await run_blocking(spill, session.history)
+    await run_blocking(sessions.save, session)
+    return {
+        "sessionId": session.session_id,
+        "scores": scores,
+        "averageScore": average,
+        "report": report,
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Model call metrics in Prometheus text format.
+    """
+    return telemetry.prometheus_text()
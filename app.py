@@ -1,233 +1,27 @@
 import os
+import sqlite3
+import uuid
 
-from dotenv import load_dotenv
 import streamlit as st
-import pandas as pd
-from groq import Groq
-from PyPDF2 import PdfReader  # For reading PDF resumes
-
-# ---------- Load API key ----------
-load_dotenv(override=True)
-API_KEY = os.getenv("GROQ_API_KEY")
-
-client = None
-if API_KEY:
-    client = Groq(api_key=API_KEY)
-
-# ---------- System prompts ----------
-INTERVIEWER_SYSTEM = """
-You are an expert technical interviewer and HR interviewer.
-You create clear, focused interview questions for software and non-software roles.
-Ask one question at a time. Do NOT answer the question yourself.
-"""
-
-EVALUATOR_SYSTEM = """
-You are an expert interview evaluator and hiring manager.
-You evaluate candidate answers for job roles and give:
-- A score from 1 to 10
-- Strengths
-- Weaknesses
-- Improvement suggestions
-
-ALWAYS respond in this exact structure:
-
-SCORE: <number from 1 to 10>
-
-STRENGTHS:
-<bullet points or short paragraph>
-
-WEAKNESSES:
-<bullet points or short paragraph>
-
-IMPROVEMENT_TIPS:
-<bullet points or short paragraph>
-"""
-
-SUMMARY_SYSTEM = """
-You are an expert hiring manager summarizing an interview.
-Based on the interview history, give:
-
-1. Overall summary (5–8 lines)
-2. Key strengths (list)
-3. Key weaknesses (list)
-4. Recommended level (e.g., Intern / Junior / Mid-level / Senior)
-5. Final recommendation: Strong Hire / Hire / Neutral / No Hire (with 1–2 line reason)
-"""
-
-SKILL_EXTRACTOR_SYSTEM = """
-You are an assistant that reads resume text and extracts the key technical and professional skills.
-Return ONLY a concise, comma-separated list of skills. Do not add explanations.
-"""
-
-# ---------- Helper: call Groq ----------
-def call_groq(
-    system_prompt: str,
-    user_prompt: str,
-    temperature: float = 0.7,
-    max_tokens: int = 2000,
-) -> str:
-    if client is None:
-        return "ERROR: GROQ_API_KEY is not set. Please configure it before using the app."
 
-    try:
-        response = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"Error while calling model: {e}"
-
-# ---------- Helper: extract skills from resume ----------
-def extract_skills_from_resume(resume_text: str) -> str:
-    """
-    Uses the LLM to extract a clean list of skills from resume text.
-    """
-    user_prompt = f"""
-Below is the full resume text.
-
-RESUME:
-\"\"\"{resume_text}\"\"\"
-
-Task:
-Extract the main technical and professional skills mentioned in this resume.
-Return ONLY a comma-separated list of skills, nothing else.
-"""
-    skills_text = call_groq(
-        SKILL_EXTRACTOR_SYSTEM,
-        user_prompt,
-        temperature=0.2,
-        max_tokens=300,
-    )
-    return skills_text.strip()
-
-# ---------- Helper: generate next question ----------
-def generate_question(
-    role: str,
-    experience: str,
-    skills: str,
-    interview_type: str,
-    question_no: int,
-) -> str:
-    user_prompt = f"""
-Job role: {role}
-Experience level: {experience}
-Key skills / technologies: {skills}
-Interview type: {interview_type}
-Question number: {question_no}
-
-Task:
-Create ONE interview question only.
-
-Guidelines:
-- Focus on the role and skills.
-- For early questions (1-2), keep it slightly easier and open-ended.
-- Later questions can be more detailed or scenario-based.
-- Do NOT include the answer.
-- Do NOT include any extra text like "Here's your question".
-
-Just output the question text.
-"""
-    question = call_groq(
-        INTERVIEWER_SYSTEM,
-        user_prompt,
-        temperature=0.6,
-        max_tokens=400,
-    )
-    return question.strip()
-
-# ---------- Helper: evaluate answer ----------
-def evaluate_answer(
-    question: str,
-    answer: str,
-    role: str,
-    experience: str,
-    skills: str,
-) -> str:
-    user_prompt = f"""
-Job role: {role}
-Experience level: {experience}
-Key skills / technologies: {skills}
-
-Interview question:
-{question}
-
-Candidate answer:
-{answer}
-
-Task:
-Evaluate the answer strictly for this role and experience level.
-Follow the required response structure.
-"""
-    evaluation = call_groq(
-        EVALUATOR_SYSTEM,
-        user_prompt,
-        temperature=0.4,
-        max_tokens=600,
-    )
-    return evaluation.strip()
-
-# ---------- Helper: parse score from evaluation ----------
-def extract_score(evaluation_text: str) -> int:
-    """
-    Looks for a line starting with 'SCORE:' and returns the integer.
-    If not found, returns -1.
-    """
-    for line in evaluation_text.splitlines():
-        line = line.strip()
-        if line.upper().startswith("SCORE"):
-            parts = line.split(":")
-            if len(parts) >= 2:
-                try:
-                    score = int(parts[1].strip().split()[0])
-                    return score
-                except ValueError:
-                    return -1
-    return -1
-
-# ---------- Helper: generate final summary ----------
-def generate_summary(
-    candidate_name: str,
-    role: str,
-    experience: str,
-    skills: str,
-    history: list,
-) -> str:
-    history_text = ""
-    for i, item in enumerate(history, start=1):
-        history_text += f"""
-Question {i}: {item['question']}
-Candidate answer: {item['answer']}
-Evaluation:
-{item['evaluation']}
-
------------------------------
-"""
-
-    user_prompt = f"""
-Candidate name: {candidate_name}
-Job role: {role}
-Experience level: {experience}
-Key skills / technologies: {skills}
-
-Interview history:
-{history_text}
-
-Task:
-Provide an overall interview summary and recommendation.
-"""
-    summary = call_groq(
-        SUMMARY_SYSTEM,
-        user_prompt,
-        temperature=0.4,
-        max_tokens=800,
-    )
-    return summary.strip()
+from llm import LLMError, client
+from history import SKIPPED_ANSWER, HistoryItem, spill
+from interview_store import get_store
+from question_bank import get_bank
+from report_export import MIME_TYPES, export_filename, report_payload, start_export
+from session_state import StaleSessionError, dumps, get_backend
+from telemetry import current_session, telemetry
+from interview import (
+    EAGER_EVALUATION,
+    EVAL_BATCH_MODE,
+    QUESTION_PLAN_MODE,
+    EvaluationQueue,
+    QuestionPrefetcher,
+    RollingSummary,
+    evaluate_history,
+    evaluate_history_batch,
+    stream_summary,
+)
 
 # ---------- Streamlit UI setup ----------
 st.set_page_config(
@@ -301,15 +95,77 @@ if client is None:
     st.error("GROQ_API_KEY is not set. Please configure it in a .env file.")
     st.stop()
 
+# Load the question bank with the first run in this process rather than on
+# the first "Start" click; later runs get the loaded bank back
+get_bank()
+
+# ---------- Session identity & shared state ----------
+# Interview progress is kept in the session backend (session_state.py) under
+# the id in the URL (?sid=...), so a reconnect to another worker process or
+# after a restart picks the interview back up.
+PERSISTED_KEYS = (
+    "interview_started",
+    "current_q_no",
+    "current_question",
+    "history",
+    "summary_generated",
+    "summary_text",
+    "candidate_name",
+    "job_role",
+    "experience_level",
+    "skills_input",
+    "interview_type",
+    "num_questions",
+)
+
+
+def restore_session() -> None:
+    """
+    Loads the persisted state for this session id into st.session_state.
+    """
+    state, version = get_backend().load(st.session_state.session_id)
+    if state:
+        st.session_state.saved_state = dumps(state)
+        state["history"] = [HistoryItem.from_dict(item) for item in state["history"]]
+        st.session_state.update(state)
+    else:
+        st.session_state.saved_state = None
+    st.session_state.state_version = version
+
+
+if "session_id" not in st.session_state:
+    st.session_state.session_id = st.query_params.get("sid") or uuid.uuid4().hex
+    st.query_params["sid"] = st.session_state.session_id
+    restore_session()
+elif st.session_state.pop("reload_session", False):
+    # Must run before the sidebar widgets are created
+    restore_session()
+# Tag every model call made during this run with the session for telemetry
+current_session.set(st.session_state.session_id)
+
 # ---------- Sidebar: Candidate & Job Info ----------
+# Defaults go through session state rather than the widgets, so values
+# restored from the session backend are not overridden
+SIDEBAR_DEFAULTS = {
+    "candidate_name": "",
+    "job_role": "",
+    "experience_level": "Fresher",
+    "skills_input": "",
+    "interview_type": "Mixed",
+    "num_questions": 5,
+}
+for key, value in SIDEBAR_DEFAULTS.items():
+    if key not in st.session_state:
+        st.session_state[key] = value
+
 st.sidebar.header("👤 Candidate & Job Info")
 
-candidate_name = st.sidebar.text_input("Candidate name", placeholder="e.g., Pavan")
-job_role = st.sidebar.text_input("Job role", placeholder="e.g., Python Developer Intern")
+candidate_name = st.sidebar.text_input("Candidate name", key="candidate_name", placeholder="e.g., Pavan")
+job_role = st.sidebar.text_input("Job role", key="job_role", placeholder="e.g., Python Developer Intern")
 experience_level = st.sidebar.selectbox(
     "Experience level",
     ["Fresher", "0–1 years", "1–3 years", "3–5 years", "5+ years"],
-    index=0,
+    key="experience_level",
 )
 
 st.sidebar.subheader("📄 Resume & Skills")
@@ -320,30 +176,24 @@ resume_file = st.sidebar.file_uploader(
     help="If provided, the agent will try to auto-extract key skills.",
 )
 
-# Session state for skills input
-if "skills_input" not in st.session_state:
-    st.session_state.skills_input = ""
-
 # Button to extract skills from resume
 if resume_file is not None:
     if st.sidebar.button("✨ Extract skills from resume"):
-        try:
-            if resume_file.name.lower().endswith(".pdf"):
-                reader = PdfReader(resume_file)
-                text_content = ""
-                for page in reader.pages:
-                    text_content += page.extract_text() or ""
-            else:  # assume .txt file
-                text_content = resume_file.read().decode("utf-8", errors="ignore")
+        # Imported on first use so PyPDF2 and the extraction pool stay out of
+        # sessions that never upload a resume
+        from resume import resume_skills
 
+        try:
             with st.spinner("Extracting skills from resume..."):
-                extracted = extract_skills_from_resume(text_content)
+                extracted = resume_skills(resume_file.getvalue(), resume_file.name)
 
-            if extracted.startswith("ERROR"):
-                st.sidebar.error(extracted)
+            if not extracted:
+                st.sidebar.warning("No text could be read from this resume.")
             else:
                 st.session_state.skills_input = extracted
                 st.sidebar.success("Skills extracted from resume!")
+        except LLMError as e:
+            st.sidebar.error(f"Skill extraction failed: {e}")
         except Exception as e:
             st.sidebar.error(f"Failed to read resume: {e}")
 
@@ -356,10 +206,30 @@ skills = st.sidebar.text_area(
 interview_type = st.sidebar.selectbox(
     "Interview type",
     ["Technical", "HR / Behavioral", "Mixed"],
-    index=2,
+    key="interview_type",
+)
+
+num_questions = st.sidebar.slider("Number of questions (target)", 3, 10, key="num_questions")
+
+plan_questions = st.sidebar.checkbox(
+    "Plan all questions in one request",
+    value=QUESTION_PLAN_MODE,
+    help="Generates the whole interview up front so questions build on each other without repeats.",
+)
+
+batch_evaluation = st.sidebar.checkbox(
+    "Evaluate all answers in one request",
+    value=EVAL_BATCH_MODE,
+    help="Uses fewer API requests and tokens. Answers the batch misses are re-evaluated one by one.",
 )
 
-num_questions = st.sidebar.slider("Number of questions (target)", 3, 10, 5)
+# Background evaluation would leave the batch nothing to batch, so the two are exclusive
+eager_evaluation = st.sidebar.checkbox(
+    "Evaluate answers in the background",
+    value=EAGER_EVALUATION,
+    disabled=batch_evaluation,
+    help="Each answer is evaluated as soon as it is saved. Scores stay hidden until you submit, which then only waits for the last answers. Not available with one-request evaluation.",
+) and not batch_evaluation
 
 st.sidebar.info(
     "Fill these details first. The agent will use them to generate relevant questions and later evaluate all answers at once."
@@ -375,17 +245,111 @@ if "current_question" not in st.session_state:
 if "current_q_no" not in st.session_state:
     st.session_state.current_q_no = 0
 if "history" not in st.session_state:
-    st.session_state.history = []  # list of dicts: question_no, question, answer, evaluation, score
+    st.session_state.history = []  # list of history.HistoryItem
 if "summary_generated" not in st.session_state:
     st.session_state.summary_generated = False
 if "summary_text" not in st.session_state:
     st.session_state.summary_text = ""
+if "question_prefetcher" not in st.session_state:
+    st.session_state.question_prefetcher = QuestionPrefetcher()
+if "evaluation_queue" not in st.session_state:
+    st.session_state.evaluation_queue = EvaluationQueue()
+
+question_inputs = dict(
+    role=job_role,
+    experience=experience_level,
+    skills=skills,
+    interview_type=interview_type,
+)
+
+
+def next_question(question_no: int) -> str:
+    """
+    Returns question question_no, using the prefetched one when possible.
+    On a model error the error is flashed and "" is returned, so
+    'Start / Continue Interview' can retry.
+    """
+    try:
+        return st.session_state.question_prefetcher.get(
+            **question_inputs,
+            question_no=question_no,
+        )
+    except LLMError as e:
+        flash(
+            "error",
+            f"Could not generate question {question_no}: {e} "
+            "Click 'Start / Continue Interview' to retry.",
+        )
+        return ""
+
+
+def flash(kind: str, message: str) -> None:
+    """
+    Queues a message to show in the interview panel after the next rerun.
+    """
+    st.session_state.flash = (kind, message)
+
+
+def persist_session() -> None:
+    """
+    Saves the persisted keys to the session backend if they changed. If the
+    interview was saved elsewhere in the meantime (e.g. a second tab), the
+    newer state is loaded instead of being overwritten.
+    """
+    state = {key: st.session_state[key] for key in PERSISTED_KEYS}
+    state["history"] = [item.to_dict() for item in state["history"]]
+    data = dumps(state)
+    if data == st.session_state.saved_state:
+        return
+    try:
+        st.session_state.state_version = get_backend().save(
+            st.session_state.session_id, state, st.session_state.state_version
+        )
+    except StaleSessionError:
+        st.session_state.reload_session = True
+        flash("warning", "This interview was changed in another window. Showing the latest version.")
+        st.rerun()
+    st.session_state.saved_state = data
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def history_tags_html(tags: tuple) -> str:
+    """
+    Answered/skipped tag strip for ((question_no, label), ...).
+    """
+    spans = []
+    for question_no, label in tags:
+        color = "#f97316" if label == "Skipped" else "#22c55e"
+        spans.append(
+            f"<span style='font-size:11px;padding:4px 8px;border-radius:999px;"
+            f"border:1px solid #e5e7ff;background:#f9fafb;margin-right:4px;"
+            f"color:{color};'>Q{question_no}: {label}</span>"
+        )
+    return " ".join(spans)
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def score_table(rows: tuple) -> tuple:
+    """
+    Column data for the scores table and the average score (or None)
+    for ((question_no, score, answered), ...).
+    """
+    columns = {
+        "Q No": [row[0] for row in rows],
+        "Score": [row[1] for row in rows],
+        "Answered": ["Yes" if row[2] else "Skipped" for row in rows],
+    }
+    valid_scores = [row[1] for row in rows if row[1] >= 0]
+    avg_score = sum(valid_scores) / len(valid_scores) if valid_scores else None
+    return columns, avg_score
 
-# ---------- Layout: two main columns ----------
-left_col, right_col = st.columns([2, 1])
 
 # ---------- Left: Interview Flow ----------
-with left_col:
+# Fragments rerun on their own when their widgets change, so typing an
+# answer does not redo the sidebar, tag strip or report panel. Anything that
+# changes the history triggers a full rerun.
+@st.fragment
+def interview_panel() -> None:
     st.markdown('<div class="stCard">', unsafe_allow_html=True)
     st.subheader("🎯 Interview Flow")
 
@@ -394,155 +358,202 @@ with left_col:
             "Please fill Candidate & Job Info and skills (or extract from resume) "
             "in the sidebar to start the interview."
         )
-    else:
-        # Start / Reset buttons row
-        c1, c2 = st.columns(2)
-        with c1:
-            start_btn = st.container()
-            with start_btn:
-                st.write("")
-                start_click = st.button("▶️ Start / Continue Interview", key="start_btn")
-        with c2:
-            reset_btn = st.container()
-            with reset_btn:
-                st.write("")
-                reset_click = st.button("🔄 Reset Interview", key="reset_btn")
-
-        if reset_click:
-            st.session_state.interview_started = False
-            st.session_state.current_question = ""
-            st.session_state.current_q_no = 0
+        st.markdown("</div>", unsafe_allow_html=True)
+        return
+
+    # Start / Reset buttons row
+    c1, c2 = st.columns(2)
+    with c1:
+        start_btn = st.container()
+        with start_btn:
+            st.write("")
+            start_click = st.button("▶️ Start / Continue Interview", key="start_btn")
+    with c2:
+        reset_btn = st.container()
+        with reset_btn:
+            st.write("")
+            reset_click = st.button("🔄 Reset Interview", key="reset_btn")
+
+    if reset_click:
+        st.session_state.interview_started = False
+        st.session_state.current_question = ""
+        st.session_state.current_q_no = 0
+        st.session_state.history = []
+        st.session_state.summary_generated = False
+        st.session_state.summary_text = ""
+        st.session_state.question_prefetcher.reset()
+        st.session_state.evaluation_queue.clear()
+        st.session_state.pop("report_exports", None)
+        flash("success", "Interview has been reset.")
+        st.rerun()
+
+    # No-op unless the inputs changed; plan() replaces per-question prefetching
+    if plan_questions and (start_click or st.session_state.interview_started):
+        st.session_state.question_prefetcher.plan(**question_inputs, num_questions=num_questions)
+
+    if start_click:
+        if not st.session_state.interview_started:
+            st.session_state.interview_started = True
+            st.session_state.current_q_no = 1
             st.session_state.history = []
             st.session_state.summary_generated = False
             st.session_state.summary_text = ""
-            st.success("Interview has been reset.")
-
-        if start_click:
-            if not st.session_state.interview_started:
-                st.session_state.interview_started = True
-                st.session_state.current_q_no = 1
-                st.session_state.history = []
-                st.session_state.summary_generated = False
-                st.session_state.summary_text = ""
-            if not st.session_state.current_question:
-                st.session_state.current_question = generate_question(
-                    role=job_role,
-                    experience=experience_level,
-                    skills=skills,
-                    interview_type=interview_type,
-                    question_no=st.session_state.current_q_no,
-                )
-
-        # Show current question & answer box
-        if st.session_state.interview_started and st.session_state.current_question:
-            st.markdown(
-                f"<p style='font-size:11px;color:#6b7280;'>Question {st.session_state.current_q_no} of {num_questions}</p>",
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                f"<div style='padding:10px 12px;border-radius:12px;background:#f9fafb;border:1px solid #e5e7eb;'>"
-                f"<div style='font-size:11px;text-transform:uppercase;letter-spacing:0.08em;color:#6b7280;margin-bottom:4px;'>Question</div>"
-                f"<div style='font-size:14px;color:#111827;'>{st.session_state.current_question}</div>"
-                f"</div>",
-                unsafe_allow_html=True,
+        if not st.session_state.current_question:
+            st.session_state.current_question = next_question(st.session_state.current_q_no)
+
+    # After the start button, so an error from next_question() shows right away
+    if "flash" in st.session_state:
+        kind, message = st.session_state.pop("flash")
+        getattr(st, kind)(message)
+
+    # Show current question & answer box
+    if st.session_state.interview_started and st.session_state.current_question:
+        # Start generating the next question while this one is answered
+        if st.session_state.current_q_no < num_questions:
+            st.session_state.question_prefetcher.prefetch(
+                **question_inputs,
+                question_no=st.session_state.current_q_no + 1,
             )
 
-            answer = st.text_area(
-                "Type candidate's answer here:",
-                key=f"answer_q_{st.session_state.current_q_no}",
-                height=150,
-            )
+        st.markdown(
+            f"<p style='font-size:11px;color:#6b7280;'>Question {st.session_state.current_q_no} of {num_questions}</p>",
+            unsafe_allow_html=True,
+        )
+        st.markdown(
+            f"<div style='padding:10px 12px;border-radius:12px;background:#f9fafb;border:1px solid #e5e7eb;'>"
+            f"<div style='font-size:11px;text-transform:uppercase;letter-spacing:0.08em;color:#6b7280;margin-bottom:4px;'>Question</div>"
+            f"<div style='font-size:14px;color:#111827;'>{st.session_state.current_question}</div>"
+            f"</div>",
+            unsafe_allow_html=True,
+        )
 
-            c3, c4 = st.columns(2)
-            with c3:
-                save_next_btn = st.button("💾 Save Answer & Next Question")
-            with c4:
-                skip_btn = st.button("⏭ Skip Question")
-
-            if save_next_btn:
-                if not answer.strip():
-                    st.warning("Please enter an answer before saving, or use Skip.")
-                else:
-                    st.session_state.history.append(
-                        {
-                            "question_no": st.session_state.current_q_no,
-                            "question": st.session_state.current_question,
-                            "answer": answer,
-                            "evaluation": "",  # to be filled later
-                            "score": -1,       # to be filled later
-                        }
-                    )
+        answer = st.text_area(
+            "Type candidate's answer here:",
+            key=f"answer_q_{st.session_state.current_q_no}",
+            height=150,
+        )
 
-                    if st.session_state.current_q_no < num_questions:
-                        st.session_state.current_q_no += 1
-                        st.session_state.current_question = generate_question(
-                            role=job_role,
-                            experience=experience_level,
-                            skills=skills,
-                            interview_type=interview_type,
-                            question_no=st.session_state.current_q_no,
-                        )
-                    else:
-                        st.session_state.current_question = ""
-                        st.info(
-                            "All questions completed. Go to the right panel and click "
-                            "'Submit & Generate AI Report'."
-                        )
-
-            if skip_btn:
-                st.warning("Question skipped.")
+        c3, c4, c5 = st.columns(3)
+        with c3:
+            save_next_btn = st.button("💾 Save Answer & Next Question")
+        with c4:
+            skip_btn = st.button("⏭ Skip Question")
+        with c5:
+            regenerate_btn = st.button("🔁 Different Question")
+
+        if regenerate_btn:
+            try:
+                st.session_state.current_question = st.session_state.question_prefetcher.regenerate(
+                    **question_inputs,
+                    question_no=st.session_state.current_q_no,
+                )
+            except LLMError as e:
+                st.error(f"Could not generate a different question: {e}")
+            else:
+                st.rerun()
+
+        if save_next_btn:
+            if not answer.strip():
+                st.warning("Please enter an answer before saving, or use Skip.")
+            else:
                 st.session_state.history.append(
-                    {
-                        "question_no": st.session_state.current_q_no,
-                        "question": st.session_state.current_question,
-                        "answer": "(Skipped)",
-                        "evaluation": "Not evaluated (skipped by interviewer).",
-                        "score": -1,
-                    }
+                    HistoryItem(st.session_state.current_q_no, st.session_state.current_question, answer)
                 )
-                if st.session_state.current_q_no < num_questions:
-                    st.session_state.current_q_no += 1
-                    st.session_state.current_question = generate_question(
+                if eager_evaluation:
+                    # Evaluated now, revealed only when the report is generated
+                    st.session_state.evaluation_queue.submit(
+                        st.session_state.history[-1],
                         role=job_role,
                         experience=experience_level,
                         skills=skills,
-                        interview_type=interview_type,
-                        question_no=st.session_state.current_q_no,
-                    )
-                else:
-                    st.session_state.current_question = ""
-                    st.info(
-                        "All questions completed. Go to the right panel and click "
-                        "'Submit & Generate AI Report'."
                     )
+                advance_question()
+                st.rerun()
 
-        elif st.session_state.interview_started and not st.session_state.current_question:
-            st.info(
-                "Interview questions finished. Go to the right panel and click "
-                "'Submit & Generate AI Report'."
+        if skip_btn:
+            flash("warning", "Question skipped.")
+            st.session_state.history.append(
+                HistoryItem(st.session_state.current_q_no, st.session_state.current_question, SKIPPED_ANSWER)
             )
+            advance_question()
+            st.rerun()
+
+    elif (
+        st.session_state.interview_started
+        and len(st.session_state.history) >= st.session_state.current_q_no
+    ):
+        st.info(
+            "Interview questions finished. Go to the right panel and click "
+            "'Submit & Generate AI Report'."
+        )
+    elif st.session_state.interview_started:
+        st.info("Click 'Start / Continue Interview' to load the next question.")
 
     st.markdown("</div>", unsafe_allow_html=True)
+    persist_session()
+
+
+def advance_question() -> None:
+    """
+    Moves to the next question, or flags the interview as finished.
+    """
+    if st.session_state.current_q_no < num_questions:
+        st.session_state.current_q_no += 1
+        st.session_state.current_question = next_question(st.session_state.current_q_no)
+    else:
+        st.session_state.current_question = ""
+        flash(
+            "info",
+            "All questions completed. Go to the right panel and click "
+            "'Submit & Generate AI Report'.",
+        )
+
+
+def save_interview() -> None:
+    """
+    Keeps the finished interview for the HR dashboard (pages/dashboard.py).
+    """
+    store = get_store()
+    if store is None:
+        return
+    try:
+        store.save_interview(
+            candidate_name=candidate_name,
+            role=job_role,
+            experience=experience_level,
+            interview_type=interview_type,
+            skills=skills,
+            history=st.session_state.history,
+            summary=st.session_state.summary_text,
+            source_id=st.session_state.session_id,
+        )
+    except sqlite3.Error as e:
+        st.warning(f"The report could not be saved to the dashboard: {e}")
+
+
+def start_report_export() -> None:
+    """
+    Starts rendering the PDF / JSON downloads of the finished report in the
+    background (report_export.py); cached renders come back immediately.
+    """
+    payload = report_payload(
+        candidate_name=candidate_name,
+        role=job_role,
+        experience=experience_level,
+        interview_type=interview_type,
+        skills=skills,
+        history=st.session_state.history,
+        summary=st.session_state.summary_text,
+    )
+    st.session_state.report_exports = (
+        {fmt: export_filename(payload, fmt) for fmt in MIME_TYPES},
+        start_export(payload, tuple(MIME_TYPES)),
+    )
 
-    # Small card: answered/skipped overview
-    if st.session_state.history:
-        st.markdown('<div class="stCard">', unsafe_allow_html=True)
-        st.subheader("🗂 Answered Questions")
-        st.write("Quick overview of which questions were answered or skipped:")
-        tags = []
-        for item in st.session_state.history:
-            label = "Skipped" if item["answer"] == "(Skipped)" else "Answered"
-            color = "#f97316" if label == "Skipped" else "#22c55e"
-            tags.append(
-                f"<span style='font-size:11px;padding:4px 8px;border-radius:999px;"
-                f"border:1px solid #e5e7ff;background:#f9fafb;margin-right:4px;"
-                f"color:{color};'>Q{item['question_no']}: {label}</span>"
-            )
-        st.markdown(" ".join(tags), unsafe_allow_html=True)
-        st.markdown("</div>", unsafe_allow_html=True)
 
 # ---------- Right: Scores, History, Summary ----------
-with right_col:
+@st.fragment
+def report_panel() -> None:
     st.markdown('<div class="stCard">', unsafe_allow_html=True)
     st.subheader("📊 Final Evaluation & Report")
     st.write(
@@ -554,58 +565,67 @@ with right_col:
     if st.session_state.history and not st.session_state.summary_generated:
         if st.button("📄 Submit & Generate AI Report"):
             with st.spinner("Evaluating all answers and generating final report..."):
-                # 1) Evaluate each answer (only once)
-                for item in st.session_state.history:
-                    if item["answer"] != "(Skipped)" and not item["evaluation"]:
-                        eval_text = evaluate_answer(
-                            question=item["question"],
-                            answer=item["answer"],
-                            role=job_role,
-                            experience=experience_level,
-                            skills=skills,
-                        )
-                        if eval_text.startswith("ERROR"):
-                            item["evaluation"] = "Evaluation failed."
-                            item["score"] = -1
-                        else:
-                            item["evaluation"] = eval_text
-                            item["score"] = extract_score(eval_text)
-
-                # 2) Generate summary based on updated history
-                summary = generate_summary(
-                    candidate_name=candidate_name,
+                # 1) Evaluate each answer (only once), several at a time
+                progress = st.progress(0.0, text="Evaluating answers...")
+                rolling = RollingSummary()
+
+                def on_progress(done: int, total: int) -> None:
+                    # Fold finished evaluations into the compact summary digest
+                    rolling.update(st.session_state.history)
+                    progress.progress(done / total, text=f"Evaluated {done} of {total} answers")
+
+                # Background evaluations first; anything missing is evaluated now
+                st.session_state.evaluation_queue.collect(
+                    st.session_state.history, on_progress=on_progress
+                )
+                evaluate = evaluate_history_batch if batch_evaluation else evaluate_history
+                evaluate(
+                    st.session_state.history,
                     role=job_role,
                     experience=experience_level,
                     skills=skills,
-                    history=st.session_state.history,
+                    on_progress=on_progress,
                 )
-
-            if summary.startswith("ERROR"):
-                st.error(summary)
+                progress.empty()
+
+            # 2) Stream the summary based on updated history as it is written
+            st.markdown("#### 🧾 Final Interview Report")
+            try:
+                summary = st.write_stream(
+                    stream_summary(
+                        candidate_name=candidate_name,
+                        role=job_role,
+                        experience=experience_level,
+                        skills=skills,
+                        history=st.session_state.history,
+                        rolling=rolling,
+                    )
+                ).strip()
+            except LLMError as e:
+                st.error(f"Report generation failed: {e}")
             else:
                 st.session_state.summary_text = summary
                 st.session_state.summary_generated = True
+                save_interview()
+                start_report_export()
+                # Finished: only scores stay in memory, the text goes to disk
+                spill(st.session_state.history)
+                st.rerun()
 
     # Show scores + report after generated
     if st.session_state.summary_generated and st.session_state.summary_text:
         # Scores table
-        df_rows = []
-        for item in st.session_state.history:
-            df_rows.append(
-                {
-                    "Q No": item["question_no"],
-                    "Score": item["score"],
-                    "Answered": "Yes" if item["answer"] != "(Skipped)" else "Skipped",
-                }
+        if st.session_state.history:
+            columns, avg_score = score_table(
+                tuple(
+                    (item.question_no, item.score, not item.skipped)
+                    for item in st.session_state.history
+                )
             )
-        if df_rows:
-            df = pd.DataFrame(df_rows)
             st.markdown("**Question-wise Scores**")
-            st.dataframe(df, hide_index=True, use_container_width=True)
+            st.dataframe(columns, hide_index=True, use_container_width=True)
 
-            valid_scores = [x["score"] for x in st.session_state.history if x["score"] >= 0]
-            if valid_scores:
-                avg_score = sum(valid_scores) / len(valid_scores)
+            if avg_score is not None:
                 st.metric("Average Score", f"{avg_score:.1f} / 10")
 
         # Final report
@@ -613,6 +633,91 @@ with right_col:
         st.markdown(st.session_state.summary_text)
 
     st.markdown("</div>", unsafe_allow_html=True)
+    persist_session()
+
+
+def report_downloads() -> None:
+    """
+    Download buttons for the exported report. While the export is still
+    rendering this runs as a polling fragment; once it is done a full rerun
+    turns the polling off.
+    """
+    if "report_exports" not in st.session_state:
+        start_report_export()  # e.g. after the session was restored
+    files, futures = st.session_state.report_exports
+    if not all(future.done() for future in futures.values()):
+        st.caption("⏳ Preparing PDF / JSON downloads...")
+        return
+    if st.session_state.pop("report_exports_polling", False):
+        st.rerun()
+
+    cols = st.columns(len(futures))
+    for col, (fmt, future) in zip(cols, futures.items()):
+        try:
+            data = future.result()
+        except Exception as e:
+            col.error(f"{fmt.upper()} export failed: {e}")
+            continue
+        col.download_button(
+            f"⬇️ Download {fmt.upper()}",
+            data,
+            file_name=files[fmt],
+            mime=MIME_TYPES[fmt],
+            key=f"download_{fmt}",
+        )
+
+
+# ---------- Layout: two main columns ----------
+left_col, right_col = st.columns([2, 1])
+
+with left_col:
+    interview_panel()
+
+    # Small card: answered/skipped overview
+    if st.session_state.history:
+        st.markdown('<div class="stCard">', unsafe_allow_html=True)
+        st.subheader("🗂 Answered Questions")
+        st.write("Quick overview of which questions were answered or skipped:")
+        st.markdown(
+            history_tags_html(
+                tuple(
+                    (item.question_no, "Skipped" if item.skipped else "Answered")
+                    for item in st.session_state.history
+                )
+            ),
+            unsafe_allow_html=True,
+        )
+        st.markdown("</div>", unsafe_allow_html=True)
+
+with right_col:
+    report_panel()
+
+    if st.session_state.summary_generated and st.session_state.summary_text:
+        exports = st.session_state.get("report_exports")
+        polling = exports is None or not all(future.done() for future in exports[1].values())
+        st.session_state.report_exports_polling = polling
+        st.fragment(report_downloads, run_every=1.0 if polling else None)()
+
+# ---------- Sidebar: Diagnostics (optional) ----------
+if os.getenv("SHOW_DIAGNOSTICS", "0") == "1":
+    with st.sidebar.expander("📈 Diagnostics"):
+        rows = telemetry.summary_rows()
+        if rows:
+            st.dataframe(rows, hide_index=True, use_container_width=True)
+        else:
+            st.caption("No model calls yet.")
+        st.download_button(
+            "Download metrics (Prometheus)",
+            telemetry.prometheus_text(),
+            file_name="llm_metrics.prom",
+        )
+        st.download_button(
+            "Download recent calls (JSON lines)",
+            telemetry.jsonl(),
+            file_name="llm_calls.jsonl",
+        )
+
+persist_session()
 
 # ---------- Footer ----------
 st.markdown("---")
@@ -0,0 +1,185 @@
+"""
+Offline batch re-scoring of past interviews.
+
+Reads interview records from JSONL, one per line:
+
+    {"id": "...", "candidate_name": "...", "role": "...", "experience": "...",
+     "skills": "...", "history": [{"question_no": 1, "question": "...",
+                                   "answer": "...", ...}, ...]}
+
+`history` items are HistoryItem.to_dict() dicts (history.py). Every record is
+evaluated and summarized, and written to the output JSONL as soon as it is
+done. The output file doubles as the checkpoint: re-running the same command
+skips records already written there.
+
+    python batch_eval.py interviews.jsonl rescored.jsonl --workers 8
+"""
+import argparse
+import contextvars
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from history import HistoryItem
+from interview import EVALUATION_FAILED, evaluate_history, evaluate_history_batch, generate_summary
+from llm import LLMError
+from telemetry import current_session, telemetry
+
+
+def record_id(record: dict, line_no: int) -> str:
+    return str(record.get("id", f"line-{line_no}"))
+
+
+def load_checkpoint(output_path: str) -> set:
+    """
+    Returns the ids already written to output_path. A partially written last
+    line (from a crash mid-write) is truncated away so appends stay valid.
+    """
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+
+    with open(output_path, "rb+") as f:
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end != len(data):
+            f.truncate(end)
+    for line in data[:end].decode("utf-8").splitlines():
+        if line.strip():
+            done.add(str(json.loads(line)["id"]))
+    return done
+
+
+def read_records(input_path: str, skip: set):
+    """
+    Yields (id, record) for every record not in skip. A line that is not a
+    JSON object comes back as ("line-N", None).
+    """
+    with open(input_path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                record = None
+            if not isinstance(record, dict):
+                yield f"line-{line_no}", None
+                continue
+            rid = record_id(record, line_no)
+            if rid not in skip:
+                yield rid, record
+
+
+def process_record(rid: str, record: dict, rescore: bool, batch: bool, eval_workers: int) -> dict:
+    """
+    Evaluates and summarizes one record. Raises LLMError if any answer could
+    not be evaluated, so the record is not written and is retried next run.
+    """
+    history = []
+    for data in record.get("history", []):
+        # A failed evaluation kept from an earlier run is evaluated again
+        if rescore or data.get("evaluation") == EVALUATION_FAILED:
+            data = {**data, "evaluation": ""}
+        history.append(HistoryItem.from_dict(data))
+
+    evaluate = evaluate_history_batch if batch else evaluate_history
+    evaluate(
+        history,
+        role=record.get("role", ""),
+        experience=record.get("experience", ""),
+        skills=record.get("skills", ""),
+        max_workers=eval_workers,
+    )
+    failed = sum(1 for item in history if item.evaluation == EVALUATION_FAILED)
+    if failed:
+        raise LLMError(f"{failed} of {len(history)} answers could not be evaluated")
+    summary = generate_summary(
+        candidate_name=record.get("candidate_name", ""),
+        role=record.get("role", ""),
+        experience=record.get("experience", ""),
+        skills=record.get("skills", ""),
+        history=history,
+    )
+
+    valid_scores = [item.score for item in history if item.score >= 0]
+    return {
+        **record,
+        "id": record.get("id", rid),
+        "history": [item.to_dict() for item in history],
+        "average_score": sum(valid_scores) / len(valid_scores) if valid_scores else None,
+        "summary": summary,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Re-score interview transcripts in bulk.")
+    parser.add_argument("input", help="input JSONL of interview records")
+    parser.add_argument("output", help="output JSONL (also used as the resume checkpoint)")
+    parser.add_argument("--workers", type=int, default=4, help="interviews processed at the same time")
+    parser.add_argument("--eval-workers", type=int, default=2, help="parallel evaluations per interview")
+    parser.add_argument("--batch", action="store_true", help="evaluate each interview in one JSON request")
+    parser.add_argument(
+        "--keep-evaluations",
+        action="store_true",
+        help="reuse evaluations already present in the input instead of re-scoring them",
+    )
+    parser.add_argument("--metrics", help="write model call metrics (Prometheus text) to this file")
+    args = parser.parse_args(argv)
+
+    done = load_checkpoint(args.output)
+    if done:
+        print(f"Resuming: {len(done)} interviews already in {args.output}", file=sys.stderr)
+
+    written = failed = 0
+    records = read_records(args.input, done)
+
+    with open(args.output, "a", encoding="utf-8") as out, ThreadPoolExecutor(max_workers=args.workers) as pool:
+        in_flight = {}
+
+        def submit_next() -> bool:
+            nonlocal failed
+            for rid, record in records:
+                if record is None:
+                    failed += 1
+                    print(f"[{rid}] skipped: not a JSON object", file=sys.stderr)
+                    continue
+                ctx = contextvars.copy_context()
+                ctx.run(current_session.set, rid)  # tag telemetry with the interview id
+                future = pool.submit(
+                    ctx.run, process_record, rid, record, not args.keep_evaluations, args.batch, args.eval_workers
+                )
+                in_flight[future] = rid
+                return True
+            return False
+
+        # Keep at most 2 x workers records in memory at once
+        while len(in_flight) < args.workers * 2 and submit_next():
+            pass
+        while in_flight:
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                rid = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:  # one bad record must not stop the run
+                    failed += 1
+                    print(f"[{rid}] failed, will retry on next run: {e!r}", file=sys.stderr)
+                else:
+                    out.write(json.dumps(result, ensure_ascii=False) + "\n")
+                    out.flush()
+                    written += 1
+                    if written % 100 == 0:
+                        print(f"{written} interviews written", file=sys.stderr)
+                submit_next()
+
+    print(f"Done: {written} written, {failed} failed, {len(done)} skipped from checkpoint.", file=sys.stderr)
+    if args.metrics:
+        with open(args.metrics, "w", encoding="utf-8") as f:
+            f.write(telemetry.prometheus_text())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
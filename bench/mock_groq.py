@@ -0,0 +1,272 @@
+"""
+Local stand-in for Groq's chat-completions endpoint, for benchmarks.
+
+    python bench/mock_groq.py --port 8765 --latency 0.4 --rate-429 0.02
+
+Point the app at it with GROQ_BASE_URL=http://127.0.0.1:8765. Replies are
+canned per prompt type (skills, question, question plan / bank, evaluation,
+batch evaluation, summary), latency is log-normal around --latency, and a
+share of requests can fail with 429 (with Retry-After) or 5xx, or return a malformed SCORE line.
+"""
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+MALFORMED_SCORE_LINES = (
+    "SCORE: N/A",
+    "**SCORE:** 7",
+    "Score - 6 out of 10",
+    "SCORE: seven",
+)
+
+
+class MockConfig:
+    def __init__(
+        self,
+        latency: float = 0.3,
+        sigma: float = 0.5,
+        rate_429: float = 0.0,
+        rate_5xx: float = 0.0,
+        malformed_score: float = 0.0,
+        tokens_per_second: float = 0.0,
+        seed: int = None,
+    ):
+        self.latency = latency  # median seconds per response
+        self.sigma = sigma  # log-normal spread; 0 = fixed latency
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.malformed_score = malformed_score
+        self.tokens_per_second = tokens_per_second  # streaming pace; 0 = no pacing
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    def draw(self):
+        with self.lock:
+            self.requests += 1
+            latency = self.latency * math.exp(self.random.gauss(0, self.sigma)) if self.sigma else self.latency
+            roll = self.random.random()
+            malformed = None
+            if self.random.random() < self.malformed_score:
+                malformed = self.random.choice(MALFORMED_SCORE_LINES)
+            score = self.random.randint(3, 9)
+        if roll < self.rate_429:
+            status = 429
+        elif roll < self.rate_429 + self.rate_5xx:
+            status = 503
+        else:
+            status = 200
+        return latency, status, malformed, score
+
+BANK_QUESTION_TEMPLATES = (
+    "How would you explain the core ideas of {topic} to a new teammate?",
+    "Describe a bug you tracked down while working with {topic} and how you found it.",
+    "What trade-offs do you weigh when choosing {topic} for a new project?",
+    "Walk me through testing a feature built with {topic} before release.",
+    "Which common mistakes do beginners make with {topic}, and how can they be avoided?",
+    "Design a small system around {topic} that has to handle ten times today's load.",
+    "Tell me about a time you had to learn part of {topic} quickly under a deadline.",
+    "How do you keep code that uses {topic} readable as the team grows?",
+)
+
+
+def canned_reply(system_prompt: str, user_prompt: str, malformed: str, score: int) -> str:
+    """
+    Reply for the prompt type; `malformed` replaces the SCORE line of an evaluation.
+    """
+    if "several candidate answers" in system_prompt:
+        ids = [int(n) for n in re.findall(r"Question id: (\d+)", user_prompt)]
+        return json.dumps(
+            {
+                "evaluations": [
+                    {
+                        "id": n,
+                        "score": score,
+                        "strengths": "Clear structure and relevant examples.",
+                        "weaknesses": "Some edge cases were not discussed.",
+                        "improvement_tips": "Quantify impact and mention trade-offs.",
+                    }
+                    for n in ids
+                ]
+            }
+        )
+    if "evaluator" in system_prompt:
+        score_line = malformed or f"SCORE: {score}"
+        return (
+            f"{score_line}\n\nSTRENGTHS:\n- Clear structure\n- Relevant examples\n\n"
+            "WEAKNESSES:\n- Missed some edge cases\n\n"
+            "IMPROVEMENT_TIPS:\n- Quantify impact and discuss trade-offs"
+        )
+    if "summarizing an interview" in system_prompt:
+        return (
+            "1. Overall summary: The candidate showed solid fundamentals and communicated clearly.\n"
+            "2. Key strengths:\n- Fundamentals\n- Communication\n"
+            "3. Key weaknesses:\n- Edge cases\n"
+            "4. Recommended level: Junior\n"
+            "5. Final recommendation: Hire - good foundation with room to grow."
+        )
+    if '{"questions"' in system_prompt:
+        count = int(re.search(r"(?:Write|Create exactly) (\d+)", user_prompt).group(1))
+        focus = re.search(r"Focus skill / technology: (.+)", user_prompt)
+        topic = focus.group(1) if focus else "this role"
+        # Every other question is a reworded repeat so deduplication has work to do
+        return json.dumps(
+            {
+                "questions": [
+                    BANK_QUESTION_TEMPLATES[(i // 2 + score) % len(BANK_QUESTION_TEMPLATES)].format(topic=topic)
+                    + (" Be specific." if i % 2 else "")
+                    for i in range(count)
+                ]
+            }
+        )
+    if "extracts the key technical" in system_prompt:
+        return "Python, SQL, Django, REST APIs, Git"
+    match = re.search(r"Question number: (\d+)", user_prompt)
+    number = match.group(1) if match else "?"
+    return f"Mock question {number}: describe a project where you applied these skills and what you would do differently."
+
+
+class MockGroqHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config = MockConfig()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: dict, headers: dict = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if not self.path.endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+
+        request = json.loads(body or b"{}")
+        latency, status, malformed, score = self.config.draw()
+        time.sleep(latency)
+        if status == 429:
+            self._send_json(
+                429,
+                {"error": {"message": "Rate limit reached (mock)", "type": "tokens"}},
+                {"Retry-After": "1"},
+            )
+            return
+        if status != 200:
+            self._send_json(status, {"error": {"message": "Service unavailable (mock)"}})
+            return
+
+        messages = request.get("messages", [])
+        system_prompt = messages[0]["content"] if messages else ""
+        user_prompt = messages[-1]["content"] if messages else ""
+        content = canned_reply(system_prompt, user_prompt, malformed, score)
+        usage = {
+            "prompt_tokens": (len(system_prompt) + len(user_prompt)) // 4,
+            "completion_tokens": len(content) // 4,
+            "total_tokens": (len(system_prompt) + len(user_prompt) + len(content)) // 4,
+        }
+        base = {
+            "id": f"chatcmpl-mock-{self.config.requests}",
+            "created": int(time.time()),
+            "model": request.get("model", "mock"),
+        }
+
+        if not request.get("stream"):
+            self._send_json(
+                200,
+                {
+                    **base,
+                    "object": "chat.completion",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": content},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": usage,
+                },
+            )
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        words = re.findall(r"\S+\s*", content)
+        for i, word in enumerate(words):
+            chunk = {
+                **base,
+                "object": "chat.completion.chunk",
+                "choices": [{"index": 0, "delta": {"content": word}, "finish_reason": None}],
+            }
+            if i == len(words) - 1:
+                chunk["choices"][0]["finish_reason"] = "stop"
+                chunk["x_groq"] = {"id": base["id"], "usage": usage}
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+            if self.config.tokens_per_second:
+                time.sleep(1 / self.config.tokens_per_second)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+        self.close_connection = True
+
+
+def start_mock_server(config: MockConfig, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """
+    Starts the mock in a daemon thread and returns the server
+    (its URL is http://{host}:{server.server_port}).
+    """
+    handler = type("ConfiguredMockGroqHandler", (MockGroqHandler,), {"config": config})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_mock_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency", type=float, default=0.3, help="median response latency in seconds")
+    parser.add_argument("--sigma", type=float, default=0.5, help="log-normal latency spread (0 = fixed)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="share of requests answered with 429")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="share of requests answered with 503")
+    parser.add_argument("--malformed-score", type=float, default=0.0, help="share of evaluations with a bad SCORE line")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0, help="streaming pace (0 = unpaced)")
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def config_from_args(args) -> MockConfig:
+    return MockConfig(
+        latency=args.latency,
+        sigma=args.sigma,
+        rate_429=args.rate_429,
+        rate_5xx=args.rate_5xx,
+        malformed_score=args.malformed_score,
+        tokens_per_second=args.tokens_per_second,
+        seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mock Groq chat-completions server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+    server = start_mock_server(config_from_args(args), args.host, args.port)
+    print(f"Mock Groq listening on http://{args.host}:{server.server_port}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,214 @@
+"""
+End-to-end benchmark of the interview flow against the local mock Groq server.
+
+    python bench/run_bench.py --interviewers 20 --questions 5 --latency 0.4
+    python bench/run_bench.py --apptest --interviewers 4      # drive app.py via Streamlit AppTest
+
+Reports question latency (what an interviewer waits after "Save Answer &
+Next Question"), report generation time and throughput. --max-question-p95
+and --max-report-p95 make it exit non-zero on a regression.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_groq import add_mock_arguments, config_from_args, start_mock_server  # noqa: E402
+
+ROLES = ["Python Developer Intern", "Data Analyst", "Backend Engineer", "QA Engineer"]
+SKILLS = "Python, SQL, Django, REST APIs, Git"
+
+
+def percentile(values: list, q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(q * (len(values) - 1))))
+    return values[index]
+
+
+def simulate_interview(n: int, args) -> dict:
+    """
+    One interviewer going through the app's helper flow: prefetching
+    questions while "typing", then generating the report.
+    """
+    from history import HistoryItem
+    from interview import (
+        EvaluationQueue,
+        QuestionPrefetcher,
+        evaluate_history,
+        evaluate_history_batch,
+        generate_summary,
+    )
+
+    inputs = dict(
+        role=ROLES[n % len(ROLES)],
+        experience="0–1 years",
+        skills=SKILLS,
+        interview_type="Mixed",
+    )
+    prefetcher = QuestionPrefetcher()
+    queue = EvaluationQueue()
+    history = []
+    question_latencies = []
+
+    started = time.monotonic()
+    question = prefetcher.get(**inputs, question_no=1)
+    question_latencies.append(time.monotonic() - started)
+    for q_no in range(1, args.questions + 1):
+        if q_no < args.questions:
+            prefetcher.prefetch(**inputs, question_no=q_no + 1)
+        time.sleep(args.think_time)  # interviewer typing the answer
+        history.append(HistoryItem(q_no, question, f"Answer {q_no} from candidate {n}."))
+        if args.eager:
+            queue.submit(history[-1], role=inputs["role"], experience=inputs["experience"], skills=SKILLS)
+        if q_no < args.questions:
+            started = time.monotonic()
+            question = prefetcher.get(**inputs, question_no=q_no + 1)
+            question_latencies.append(time.monotonic() - started)
+
+    started = time.monotonic()
+    queue.collect(history)
+    evaluate = evaluate_history_batch if args.batch else evaluate_history
+    evaluate(history, role=inputs["role"], experience=inputs["experience"], skills=SKILLS)
+    generate_summary(
+        candidate_name=f"Candidate {n}",
+        role=inputs["role"],
+        experience=inputs["experience"],
+        skills=SKILLS,
+        history=history,
+    )
+    report_time = time.monotonic() - started
+
+    return {
+        "question_latencies": question_latencies,
+        "report_time": report_time,
+        "unscored": sum(1 for item in history if item.score < 0),
+    }
+
+
+def simulate_apptest(n: int, args) -> dict:
+    """
+    One interviewer clicking through app.py with Streamlit's AppTest.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=120)
+    at.run()
+    at.sidebar.text_input[0].input(f"Candidate {n}")
+    at.sidebar.text_input[1].input(ROLES[n % len(ROLES)])
+    at.sidebar.text_area(key="skills_input").input(SKILLS)
+    at.run()
+
+    question_latencies = []
+    started = time.monotonic()
+    at.button(key="start_btn").click().run()
+    question_latencies.append(time.monotonic() - started)
+    for q_no in range(1, args.questions + 1):
+        time.sleep(args.think_time)
+        at.text_area(key=f"answer_q_{q_no}").input(f"Answer {q_no} from candidate {n}.")
+        save = next(b for b in at.button if b.label.startswith("💾"))
+        started = time.monotonic()
+        save.click().run()
+        if q_no < args.questions:
+            question_latencies.append(time.monotonic() - started)
+        at.run()  # the new question's widgets appear on the rerun after the click
+
+    started = time.monotonic()
+    next(b for b in at.button if b.label.startswith("📄")).click().run()
+    report_time = time.monotonic() - started
+
+    unscored = sum(1 for item in at.session_state.history if item.score < 0)
+    return {"question_latencies": question_latencies, "report_time": report_time, "unscored": unscored}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the interview flow against a mock Groq server.")
+    parser.add_argument("--interviewers", type=int, default=10, help="concurrent simulated interviewers")
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--think-time", type=float, default=1.0, help="seconds spent typing each answer")
+    parser.add_argument("--batch", action="store_true", help="use single-request batch evaluation")
+    parser.add_argument("--eager", action="store_true", help="evaluate answers in the background as they are saved")
+    parser.add_argument("--apptest", action="store_true", help="drive app.py through Streamlit AppTest")
+    parser.add_argument("--rpm", type=float, default=0, help="GROQ_RPM_LIMIT for the run (0 = unlimited)")
+    parser.add_argument("--tpm", type=float, default=0, help="GROQ_TPM_LIMIT for the run (0 = unlimited)")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    parser.add_argument("--max-question-p95", type=float, help="fail if question p95 exceeds this (seconds)")
+    parser.add_argument("--max-report-p95", type=float, help="fail if report p95 exceeds this (seconds)")
+    add_mock_arguments(parser)
+    args = parser.parse_args(argv)
+
+    server = start_mock_server(config_from_args(args))
+    # Must be set before the app modules are imported; load_dotenv() does
+    # not override GROQ_BASE_URL, so calls stay on the mock.
+    os.environ.update(
+        {
+            "GROQ_API_KEY": "mock-key",
+            "GROQ_BASE_URL": f"http://127.0.0.1:{server.server_port}",
+            "LLM_CACHE_PATH": "",
+            "INTERVIEW_STORE_PATH": "",
+            "SESSION_BACKEND": "memory",
+            "GROQ_RPM_LIMIT": str(args.rpm),
+            "GROQ_TPM_LIMIT": str(args.tpm),
+        }
+    )
+    import llm
+
+    llm.client = llm.client.with_options(api_key="mock-key")  # never send the real key anywhere
+
+    if args.apptest:
+        # AppTest keeps one global runtime per process, so every simulated
+        # interviewer gets its own process; they all talk to the mock over HTTP.
+        simulate, executor = simulate_apptest, ProcessPoolExecutor
+    else:
+        simulate, executor = simulate_interview, ThreadPoolExecutor
+    started = time.monotonic()
+    with executor(max_workers=args.interviewers) as pool:
+        results = list(pool.map(partial(simulate, args=args), range(args.interviewers)))
+    elapsed = time.monotonic() - started
+    server.shutdown()
+
+    question_latencies = [x for r in results for x in r["question_latencies"]]
+    report_times = [r["report_time"] for r in results]
+    summary = {
+        "mode": "apptest" if args.apptest else "helpers",
+        "interviewers": args.interviewers,
+        "questions": args.questions,
+        "mock_requests": server.RequestHandlerClass.config.requests,
+        "question_p50": percentile(question_latencies, 0.5),
+        "question_p95": percentile(question_latencies, 0.95),
+        "question_max": max(question_latencies, default=0.0),
+        "report_p50": percentile(report_times, 0.5),
+        "report_p95": percentile(report_times, 0.95),
+        "report_mean": statistics.mean(report_times) if report_times else 0.0,
+        "unscored_answers": sum(r["unscored"] for r in results),
+        "elapsed": elapsed,
+        "interviews_per_minute": 60 * len(results) / elapsed if elapsed else 0.0,
+    }
+
+    for name, value in summary.items():
+        print(f"{name:24} {value:.3f}" if isinstance(value, float) else f"{name:24} {value}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+    failed = False
+    if args.max_question_p95 is not None and summary["question_p95"] > args.max_question_p95:
+        print(f"FAIL: question p95 {summary['question_p95']:.3f}s > {args.max_question_p95}s")
+        failed = True
+    if args.max_report_p95 is not None and summary["report_p95"] > args.max_report_p95:
+        print(f"FAIL: report p95 {summary['report_p95']:.3f}s > {args.max_report_p95}s")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
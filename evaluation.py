@@ -0,0 +1,54 @@
+"""
+Parsing of evaluations in the EVALUATOR_SYSTEM layout (interview.py).
+No dependencies, so history records and report exports can use it without
+loading the model client.
+"""
+import re
+
+
+# ---------- Helper: parse score from evaluation ----------
+def extract_score(evaluation_text: str) -> int:
+    """
+    Looks for a line starting with 'SCORE:' and returns the integer.
+    If not found, returns -1.
+    """
+    for line in evaluation_text.splitlines():
+        line = line.strip()
+        if line.upper().startswith("SCORE"):
+            parts = line.split(":")
+            if len(parts) >= 2:
+                try:
+                    score = int(parts[1].strip().split()[0])
+                    return score
+                except ValueError:
+                    return -1
+    return -1
+
+# ---------- Helper: split evaluation into sections ----------
+EVALUATION_SECTION_RE = re.compile(
+    r"^[\s*#]*(SCORE|STRENGTHS|WEAKNESSES|IMPROVEMENT[_ ]TIPS)[\s*]*:[\s*]*(.*)$",
+    re.IGNORECASE,
+)
+
+
+def parse_evaluation(evaluation_text: str) -> dict:
+    """
+    Splits an evaluation in the EVALUATOR_SYSTEM layout into
+    {"score", "strengths", "weaknesses", "improvement_tips"}.
+    Missing sections are returned as "".
+    """
+    sections = {"strengths": [], "weaknesses": [], "improvement_tips": []}
+    current = None
+    for line in evaluation_text.splitlines():
+        match = EVALUATION_SECTION_RE.match(line)
+        if match:
+            name = match.group(1).lower().replace(" ", "_")
+            current = sections.get(name)
+            if current is not None and match.group(2).strip():
+                current.append(match.group(2).strip())
+        elif current is not None and line.strip():
+            current.append(line.strip())
+
+    parsed = {name: "\n".join(lines) for name, lines in sections.items()}
+    parsed["score"] = extract_score(evaluation_text)
+    return parsed
@@ -0,0 +1,240 @@
+"""
+Compact records for interview history (st.session_state.history and the
+API's session history).
+
+Each answered or skipped question is one slotted HistoryItem instead of a
+free-form dict. The evaluation is parsed once, when it is set, into a score
+and its sections. Question text is interned, because the same questions
+come back from the bank, the plan and the response cache. Long answers and
+evaluations are kept zlib-compressed.
+
+Once an interview is finished, spill() moves its text to a file under
+HISTORY_SPILL_DIR. Only the question numbers, scores and skipped flags stay
+in memory, and the text is read back from disk when something asks for it.
+Spill files expire after SESSION_TTL_SECONDS; an item whose file is gone
+reads back as SPILL_EXPIRED.
+"""
+import json
+import os
+import sys
+import time
+import uuid
+import zlib
+from functools import lru_cache
+
+from evaluation import parse_evaluation
+from session_state import SESSION_TTL_SECONDS
+
+# ---------- Config ----------
+HISTORY_COMPRESS_MIN_CHARS = int(os.getenv("HISTORY_COMPRESS_MIN_CHARS", "256"))
+HISTORY_SPILL_DIR = os.getenv("HISTORY_SPILL_DIR", ".history_spill")  # empty = keep finished interviews in memory
+
+SKIPPED_ANSWER = "(Skipped)"
+SKIPPED_EVALUATION = "Not evaluated (skipped by interviewer)."
+SPILL_EXPIRED = "(No longer available: the text of this finished interview has expired.)"
+SECTIONS = ("strengths", "weaknesses", "improvement_tips")
+_SEP = "\x1f"  # between the packed evaluation and its sections
+
+
+def _pack(*fields: str):
+    """
+    Joins fields into one str, zlib-compressed to bytes when long. The
+    sections repeat the evaluation text, which compression all but removes.
+    """
+    text = _SEP.join(fields)
+    if len(text) < HISTORY_COMPRESS_MIN_CHARS:
+        return text
+    return zlib.compress(text.encode("utf-8"))
+
+
+def _unpack(data) -> list:
+    if isinstance(data, bytes):
+        data = zlib.decompress(data).decode("utf-8")
+    return data.split(_SEP)
+
+
+class HistoryItem:
+    """
+    One question of an interview: its number, text, the candidate's answer
+    and the evaluation with the score and sections parsed from it.
+    """
+
+    __slots__ = ("question_no", "score", "skipped", "_question", "_answer", "_evaluation", "_spill")
+
+    def __init__(self, question_no: int, question: str, answer: str, evaluation: str = None):
+        self.question_no = question_no
+        self._spill = None
+        self.question = question
+        self.answer = answer
+        if evaluation is None:
+            evaluation = SKIPPED_EVALUATION if self.skipped else ""
+        self.evaluation = evaluation
+
+    # ----- text fields -----
+    @property
+    def question(self) -> str:
+        if self._spill is not None:
+            return self._spilled()["question"]
+        return self._question
+
+    @question.setter
+    def question(self, text: str) -> None:
+        self._unspill()
+        self._question = sys.intern(text)
+
+    @property
+    def answer(self) -> str:
+        if self._spill is not None:
+            return self._spilled()["answer"]
+        return _unpack(self._answer)[0]
+
+    @answer.setter
+    def answer(self, text: str) -> None:
+        self._unspill()
+        self.skipped = text == SKIPPED_ANSWER
+        self._answer = _pack(text)
+
+    @property
+    def evaluation(self) -> str:
+        if self._spill is not None:
+            return self._spilled()["evaluation"]
+        return _unpack(self._evaluation)[0]
+
+    @evaluation.setter
+    def evaluation(self, text: str) -> None:
+        """
+        Also sets score and sections; "" marks the answer as not evaluated yet.
+        """
+        self._unspill()
+        parsed = parse_evaluation(text)
+        self.score = parsed["score"]
+        self._evaluation = _pack(text, *(parsed[name] for name in SECTIONS))
+
+    @property
+    def sections(self) -> dict:
+        """
+        {"strengths", "weaknesses", "improvement_tips"} of the evaluation.
+        """
+        if self._spill is not None:
+            return dict(zip(SECTIONS, self._spilled()["sections"]))
+        return dict(zip(SECTIONS, _unpack(self._evaluation)[1:]))
+
+    # ----- serialization -----
+    def to_dict(self) -> dict:
+        """
+        JSON-safe form for the session backend. A spilled item only
+        references its file, so saving a finished session stays cheap.
+        """
+        if self._spill is not None:
+            return {
+                "question_no": self.question_no,
+                "score": self.score,
+                "skipped": self.skipped,
+                "spill": list(self._spill),
+            }
+        return {
+            "question_no": self.question_no,
+            "question": self.question,
+            "answer": self.answer,
+            "evaluation": self.evaluation,
+            "score": self.score,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HistoryItem":
+        """
+        Rebuilds an item from to_dict() output or an st.session_state.history
+        style dict (the score is taken from the evaluation text).
+        """
+        if "spill" in data:
+            item = cls.__new__(cls)
+            item.question_no = data["question_no"]
+            item.score = data["score"]
+            item.skipped = data["skipped"]
+            item._question = item._answer = item._evaluation = None
+            item._spill = tuple(data["spill"])
+            return item
+        return cls(
+            data["question_no"],
+            data["question"],
+            data["answer"],
+            data.get("evaluation") or None,
+        )
+
+    # ----- spilling -----
+    def _spilled(self) -> dict:
+        path, index = self._spill
+        try:
+            return _read_spill(path)[index]
+        except FileNotFoundError:
+            # Expired by _expire() while the session itself was kept longer
+            return {
+                "question": SPILL_EXPIRED,
+                "answer": SPILL_EXPIRED,
+                "evaluation": SPILL_EXPIRED,
+                "sections": [""] * len(SECTIONS),
+            }
+
+    def _unspill(self) -> None:
+        """
+        Brings spilled text back into memory before a field changes.
+        """
+        if self._spill is None:
+            return
+        data = self._spilled()
+        self._spill = None
+        self._question = sys.intern(data["question"])
+        self._answer = _pack(data["answer"])
+        self._evaluation = _pack(data["evaluation"], *data["sections"])
+
+    def __repr__(self) -> str:
+        return f"HistoryItem(question_no={self.question_no}, score={self.score}, skipped={self.skipped})"
+
+
+@lru_cache(maxsize=16)
+def _read_spill(path: str) -> tuple:
+    with open(path, "rb") as f:
+        return tuple(json.loads(zlib.decompress(f.read()).decode("utf-8")))
+
+
+def spill(history: list, spill_dir: str = HISTORY_SPILL_DIR) -> None:
+    """
+    Moves the text of a finished interview's items to one compressed file in
+    spill_dir; the items stay usable and read it back when needed. Spill
+    files older than SESSION_TTL_SECONDS are removed. No-op when spill_dir
+    is empty.
+    """
+    items = [item for item in history if item._spill is None]
+    if not spill_dir or not items:
+        return
+    os.makedirs(spill_dir, exist_ok=True)
+    _expire(spill_dir)
+
+    records = [
+        {
+            "question": item.question,
+            "answer": item.answer,
+            "evaluation": item.evaluation,
+            "sections": [item.sections[name] for name in SECTIONS],
+        }
+        for item in items
+    ]
+    path = os.path.abspath(os.path.join(spill_dir, f"{uuid.uuid4().hex}.json.z"))
+    data = zlib.compress(json.dumps(records, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    with open(path + ".tmp", "wb") as f:
+        f.write(data)
+    os.replace(path + ".tmp", path)
+
+    for index, item in enumerate(items):
+        item._question = item._answer = item._evaluation = None
+        item._spill = (path, index)
+
+
+def _expire(spill_dir: str) -> None:
+    cutoff = time.time() - SESSION_TTL_SECONDS
+    for entry in os.scandir(spill_dir):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass  # removed by another worker
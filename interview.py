@@ -0,0 +1,880 @@
+import contextvars
+import json
+import os
+import random
+import re
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+from evaluation import extract_score, parse_evaluation  # noqa: F401 (re-exported)
+from llm import PRIORITY_INTERACTIVE, LLMError, call_groq, stream_groq
+from question_bank import get_bank
+
+# ---------- System prompts ----------
+INTERVIEWER_SYSTEM = """
+You are an expert technical interviewer and HR interviewer.
+You create clear, focused interview questions for software and non-software roles.
+Ask one question at a time. Do NOT answer the question yourself.
+"""
+
+EVALUATOR_SYSTEM = """
+You are an expert interview evaluator and hiring manager.
+You evaluate candidate answers for job roles and give:
+- A score from 1 to 10
+- Strengths
+- Weaknesses
+- Improvement suggestions
+
+ALWAYS respond in this exact structure:
+
+SCORE: <number from 1 to 10>
+
+STRENGTHS:
+<bullet points or short paragraph>
+
+WEAKNESSES:
+<bullet points or short paragraph>
+
+IMPROVEMENT_TIPS:
+<bullet points or short paragraph>
+"""
+
+SUMMARY_SYSTEM = """
+You are an expert hiring manager summarizing an interview.
+Based on the interview history, give:
+
+1. Overall summary (5–8 lines)
+2. Key strengths (list)
+3. Key weaknesses (list)
+4. Recommended level (e.g., Intern / Junior / Mid-level / Senior)
+5. Final recommendation: Strong Hire / Hire / Neutral / No Hire (with 1–2 line reason)
+"""
+
+BATCH_EVALUATOR_SYSTEM = """
+You are an expert interview evaluator and hiring manager.
+You evaluate several candidate answers for one job role in a single pass.
+Judge every answer on its own, strictly for the given role and experience level.
+
+ALWAYS respond with ONE JSON object of this exact shape and nothing else:
+
+{"evaluations": [
+  {"id": <question id as given>,
+   "score": <integer from 1 to 10>,
+   "strengths": "<short paragraph>",
+   "weaknesses": "<short paragraph>",
+   "improvement_tips": "<short paragraph>"}
+]}
+
+Include exactly one entry per question id.
+"""
+
+PLANNER_SYSTEM = """
+You are an expert technical interviewer and HR interviewer.
+You plan a complete interview: clear, focused questions that build on each
+other without repeating a topic. Do NOT answer the questions yourself.
+
+ALWAYS respond with ONE JSON object of this exact shape and nothing else:
+
+{"questions": ["<question 1>", "<question 2>", ...]}
+"""
+
+SKILL_EXTRACTOR_SYSTEM = """
+You are an assistant that reads resume text and extracts the key technical and professional skills.
+Return ONLY a concise, comma-separated list of skills. Do not add explanations.
+"""
+
+# ---------- Helper: extract skills from resume ----------
+def extract_skills_from_resume(resume_text: str) -> str:
+    """
+    Uses the LLM to extract a clean list of skills from resume text.
+    """
+    user_prompt = f"""
+Below is the full resume text.
+
+RESUME:
+\"\"\"{resume_text}\"\"\"
+
+Task:
+Extract the main technical and professional skills mentioned in this resume.
+Return ONLY a comma-separated list of skills, nothing else.
+"""
+    skills_text = call_groq(
+        SKILL_EXTRACTOR_SYSTEM,
+        user_prompt,
+        temperature=0.2,
+        max_tokens=300,
+        purpose="skills",
+    )
+    return skills_text.strip()
+
+# ---------- Helper: generate next question ----------
+def generate_question(
+    role: str,
+    experience: str,
+    skills: str,
+    interview_type: str,
+    question_no: int,
+    avoid=(),
+    use_cache: bool = True,
+) -> str:
+    """
+    Generates question question_no. Questions in `avoid` (e.g. ones already
+    asked) are listed in the prompt so the model does not repeat them.
+    """
+    avoid_text = ""
+    if avoid:
+        avoid_text = "\nQuestions already asked (do NOT repeat or rephrase them):\n" + "\n".join(
+            f"- {q}" for q in avoid
+        ) + "\n"
+    user_prompt = f"""
+Job role: {role}
+Experience level: {experience}
+Key skills / technologies: {skills}
+Interview type: {interview_type}
+Question number: {question_no}
+{avoid_text}
+Task:
+Create ONE interview question only.
+
+Guidelines:
+- Focus on the role and skills.
+- For early questions (1-2), keep it slightly easier and open-ended.
+- Later questions can be more detailed or scenario-based.
+- Do NOT include the answer.
+- Do NOT include any extra text like "Here's your question".
+
+Just output the question text.
+"""
+    question = call_groq(
+        INTERVIEWER_SYSTEM,
+        user_prompt,
+        temperature=0.6,
+        max_tokens=400,
+        use_cache=use_cache,
+        priority=PRIORITY_INTERACTIVE,
+        purpose="question",
+    )
+    return question.strip()
+
+# ---------- Helper: plan every question in one request ----------
+QUESTION_PLAN_MODE = os.getenv("QUESTION_PLAN_MODE", "0") == "1"
+
+
+def generate_interview_plan(
+    role: str,
+    experience: str,
+    skills: str,
+    interview_type: str,
+    num_questions: int,
+) -> list:
+    """
+    Generates all num_questions questions in one JSON-mode request. The list
+    may come back shorter if the output is cut off; callers generate any
+    missing questions one by one.
+    """
+    user_prompt = f"""
+Job role: {role}
+Experience level: {experience}
+Key skills / technologies: {skills}
+Interview type: {interview_type}
+
+Task:
+Create exactly {num_questions} interview questions, in the order they will be asked.
+
+Guidelines:
+- Focus on the role and skills, covering a different topic in each question.
+- Keep questions 1-2 slightly easier and open-ended.
+- Later questions can be more detailed or scenario-based.
+- Do NOT include the answers.
+- Each list item is the question text only, without numbering.
+"""
+    response = call_groq(
+        PLANNER_SYSTEM,
+        user_prompt,
+        temperature=0.6,
+        max_tokens=min(150 * num_questions + 200, 4000),
+        json_mode=True,
+        priority=PRIORITY_INTERACTIVE,
+        purpose="question_plan",
+    )
+    return _parse_plan(response)[:num_questions]
+
+
+def _parse_plan(response: str) -> list:
+    """
+    Returns the question strings in a plan response, including the complete
+    ones from a response that was cut off.
+    """
+    try:
+        data = json.loads(response)
+        questions = data.get("questions") if isinstance(data, dict) else None
+    except json.JSONDecodeError:
+        start = response.find("[")
+        questions = re.findall(r'"((?:[^"\\]|\\.)*)"\s*[,\]]', response[start:]) if start >= 0 else []
+        questions = [json.loads(f'"{q}"') for q in questions]
+    if not isinstance(questions, list):
+        return []
+    return [q.strip() for q in questions if isinstance(q, str) and q.strip()]
+
+# ---------- Helper: prefetch the next question ----------
+PREFETCH_WORKERS = int(os.getenv("PREFETCH_WORKERS", "4"))
+_prefetch_pool = ThreadPoolExecutor(
+    max_workers=PREFETCH_WORKERS, thread_name_prefix="question-prefetch"
+)
+
+
+class QuestionPrefetcher:
+    """
+    Generates the next question in the background so moving on is instant.
+    After plan() the questions come from one interview plan request instead.
+    Questions in the precomputed bank (see question_bank.py) are served from
+    it without a model call, never repeating one within the session.
+    Keep one instance per session (e.g. in st.session_state) so the pending
+    request survives Streamlit reruns.
+    """
+
+    def __init__(self):
+        self._key = None
+        self._future = None
+        self._plan_key = None
+        self._plan = None
+        self._served = set()
+        self._rng = random.Random()
+
+    def plan(
+        self,
+        role: str,
+        experience: str,
+        skills: str,
+        interview_type: str,
+        num_questions: int,
+    ) -> None:
+        """
+        Starts generating the whole interview in the background. Later get()
+        calls for the same inputs are served from the plan.
+        """
+        key = (role, experience, skills, interview_type, num_questions)
+        if key == self._plan_key:
+            return
+        self._plan_key = key
+        self._plan = _prefetch_pool.submit(
+            contextvars.copy_context().run,
+            generate_interview_plan,
+            role=role,
+            experience=experience,
+            skills=skills,
+            interview_type=interview_type,
+            num_questions=num_questions,
+        )
+
+    def _covered_by_plan(self, key: tuple) -> bool:
+        return (
+            self._plan_key is not None
+            and key[:4] == self._plan_key[:4]
+            and key[4] <= self._plan_key[4]
+        )
+
+    def _from_plan(self, key: tuple) -> str:
+        if not self._covered_by_plan(key):
+            return ""
+        try:
+            questions = self._plan.result()
+        except LLMError:
+            return ""
+        question_no = key[4]
+        if question_no > len(questions) or questions[question_no - 1] in self._served:
+            return ""
+        return questions[question_no - 1]
+
+    def _from_bank(self, key: tuple):
+        role, experience, skills, interview_type, question_no = key
+        return get_bank().draw(
+            role, experience, skills, interview_type, question_no,
+            exclude=self._served, rng=self._rng,
+        )
+
+    def prefetch(
+        self,
+        role: str,
+        experience: str,
+        skills: str,
+        interview_type: str,
+        question_no: int,
+    ) -> None:
+        key = (role, experience, skills, interview_type, question_no)
+        if key == self._key or self._covered_by_plan(key):
+            return
+        self.clear()
+        self._key = key
+        question = self._from_bank(key)
+        if question:
+            self._future = Future()
+            self._future.set_result(question)
+            return
+        self._future = _prefetch_pool.submit(
+            contextvars.copy_context().run,
+            generate_question,
+            role=role,
+            experience=experience,
+            skills=skills,
+            interview_type=interview_type,
+            question_no=question_no,
+        )
+
+    def get(
+        self,
+        role: str,
+        experience: str,
+        skills: str,
+        interview_type: str,
+        question_no: int,
+    ) -> str:
+        """
+        Returns the prefetched question for these inputs, waiting for it if it
+        is still in flight. Anything prefetched for different inputs is thrown
+        away and the question is drawn from the bank or generated
+        synchronously instead.
+        """
+        key = (role, experience, skills, interview_type, question_no)
+        question = self._from_plan(key)
+        if question:
+            self._served.add(question)
+            return question
+
+        future = None
+        if key == self._key:
+            # Detach rather than clear(), which would cancel a request the
+            # pool has not started yet
+            future, self._key, self._future = self._future, None, None
+        self.clear()
+
+        question = ""
+        if future is not None:
+            try:
+                question = future.result()
+            except LLMError:
+                question = ""
+        if not question:
+            question = self._from_bank(key) or generate_question(
+                role=role,
+                experience=experience,
+                skills=skills,
+                interview_type=interview_type,
+                question_no=question_no,
+            )
+        self._served.add(question)
+        return question
+
+    def regenerate(
+        self,
+        role: str,
+        experience: str,
+        skills: str,
+        interview_type: str,
+        question_no: int,
+    ) -> str:
+        """
+        Generates a fresh question question_no that differs from every
+        question served so far, and puts it in the plan in place of the old one.
+        """
+        question = generate_question(
+            role=role,
+            experience=experience,
+            skills=skills,
+            interview_type=interview_type,
+            question_no=question_no,
+            avoid=sorted(self._served),
+            use_cache=False,
+        )
+        key = (role, experience, skills, interview_type, question_no)
+        if self._covered_by_plan(key) and self._plan.done() and self._plan.exception() is None:
+            questions = self._plan.result()
+            if question_no <= len(questions):
+                questions[question_no - 1] = question
+        self._served.add(question)
+        return question
+
+    def clear(self) -> None:
+        if self._future is not None:
+            self._future.cancel()
+        self._key = None
+        self._future = None
+
+    def reset(self) -> None:
+        """
+        Forgets the plan and the questions served, e.g. for a new interview.
+        """
+        self.clear()
+        if self._plan is not None:
+            self._plan.cancel()
+        self._plan_key = None
+        self._plan = None
+        self._served = set()
+
+# ---------- Helper: evaluate answer ----------
+def evaluate_answer(
+    question: str,
+    answer: str,
+    role: str,
+    experience: str,
+    skills: str,
+) -> str:
+    evaluation = call_groq(
+        EVALUATOR_SYSTEM,
+        _evaluation_prompt(question, answer, role, experience, skills),
+        temperature=0.4,
+        max_tokens=600,
+        purpose="evaluation",
+    )
+    return evaluation.strip()
+
+
+def _evaluation_prompt(
+    question: str,
+    answer: str,
+    role: str,
+    experience: str,
+    skills: str,
+) -> str:
+    return f"""
+Job role: {role}
+Experience level: {experience}
+Key skills / technologies: {skills}
+
+Interview question:
+{question}
+
+Candidate answer:
+{answer}
+
+Task:
+Evaluate the answer strictly for this role and experience level.
+Follow the required response structure.
+"""
+
+# ---------- Helper: evaluate all answers concurrently ----------
+EVAL_CONCURRENCY = int(os.getenv("EVAL_CONCURRENCY", "4"))
+EVAL_BATCH_MODE = os.getenv("EVAL_BATCH_MODE", "0") == "1"
+
+EVALUATION_FAILED = "Evaluation failed."
+
+
+def evaluate_history(
+    history: list,
+    role: str,
+    experience: str,
+    skills: str,
+    max_workers: int = EVAL_CONCURRENCY,
+    on_progress=None,
+) -> list:
+    """
+    Evaluates every answered, not-yet-evaluated item in history in place,
+    running at most max_workers model calls at the same time.
+    on_progress(done, total) is called from the caller's thread as items finish.
+    """
+    pending = [
+        item for item in history
+        if not item.skipped and not item.evaluation
+    ]
+    total = len(pending)
+    if not total:
+        return history
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total))) as pool:
+        futures = {
+            pool.submit(
+                contextvars.copy_context().run,
+                evaluate_answer,
+                question=item.question,
+                answer=item.answer,
+                role=role,
+                experience=experience,
+                skills=skills,
+            ): item
+            for item in pending
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            item = futures[future]
+            try:
+                eval_text = future.result()
+            except LLMError:
+                item.evaluation = EVALUATION_FAILED
+            else:
+                item.evaluation = eval_text
+            if on_progress is not None:
+                on_progress(done, total)
+
+    return history
+
+# ---------- Helper: evaluate answers in the background as they are saved ----------
+EAGER_EVALUATION = os.getenv("EAGER_EVALUATION", "1") == "1"
+EVAL_QUEUE_WORKERS = int(os.getenv("EVAL_QUEUE_WORKERS", "8"))
+_evaluation_pool = ThreadPoolExecutor(
+    max_workers=EVAL_QUEUE_WORKERS, thread_name_prefix="answer-eval"
+)
+
+
+class EvaluationQueue:
+    """
+    Evaluates each answer in the background as soon as it is saved. Results
+    stay inside the queue and only reach the history in collect(), so
+    nothing is shown before the report is requested. Keep one instance per
+    session (e.g. in st.session_state), like QuestionPrefetcher.
+    """
+
+    def __init__(self):
+        self._futures = {}
+
+    @staticmethod
+    def _key(item) -> tuple:
+        return item.question_no, item.question, item.answer
+
+    def submit(self, item, role: str, experience: str, skills: str) -> None:
+        """
+        Starts evaluating one history item (skipped answers are ignored).
+        """
+        key = self._key(item)
+        if item.skipped or key in self._futures:
+            return
+        self._futures[key] = _evaluation_pool.submit(
+            contextvars.copy_context().run,
+            evaluate_answer,
+            question=item.question,
+            answer=item.answer,
+            role=role,
+            experience=experience,
+            skills=skills,
+        )
+
+    def collect(self, history: list, on_progress=None) -> list:
+        """
+        Waits for the queued evaluations of history's pending items and fills
+        them in place. Items that were never queued, or whose evaluation
+        failed, are left pending for evaluate_history() to retry.
+        on_progress(done, total) counts every pending item, queued or not.
+        """
+        pending = [
+            item for item in history
+            if not item.skipped and not item.evaluation
+        ]
+        futures = {
+            self._futures[self._key(item)]: item
+            for item in pending
+            if self._key(item) in self._futures
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            item = futures[future]
+            del self._futures[self._key(item)]
+            try:
+                eval_text = future.result()
+            except LLMError:
+                eval_text = ""
+            if eval_text:
+                item.evaluation = eval_text
+            if on_progress is not None:
+                on_progress(done, len(pending))
+        return history
+
+    def clear(self) -> None:
+        for future in self._futures.values():
+            future.cancel()
+        self._futures = {}
+
+# ---------- Helper: evaluate all answers in one request ----------
+BATCH_SECTIONS = ("strengths", "weaknesses", "improvement_tips")
+
+
+def evaluate_history_batch(
+    history: list,
+    role: str,
+    experience: str,
+    skills: str,
+    max_workers: int = EVAL_CONCURRENCY,
+    on_progress=None,
+) -> list:
+    """
+    Evaluates every pending item in history with a single JSON-mode request.
+    Items missing from the response or failing validation (e.g. when the
+    output was truncated) are re-evaluated one by one with evaluate_history().
+    """
+    pending = [
+        item for item in history
+        if not item.skipped and not item.evaluation
+    ]
+    if not pending:
+        return history
+
+    qa_text = ""
+    for item in pending:
+        qa_text += f"""
+Question id: {item.question_no}
+Interview question:
+{item.question}
+
+Candidate answer:
+{item.answer}
+
+-----------------------------
+"""
+    user_prompt = f"""
+Job role: {role}
+Experience level: {experience}
+Key skills / technologies: {skills}
+
+Answers to evaluate:
+{qa_text}
+
+Task:
+Evaluate every answer above and return the required JSON object.
+"""
+    try:
+        response = call_groq(
+            BATCH_EVALUATOR_SYSTEM,
+            user_prompt,
+            temperature=0.4,
+            max_tokens=min(350 * len(pending) + 200, 8000),
+            json_mode=True,
+            purpose="evaluation_batch",
+        )
+    except LLMError:
+        response = ""
+
+    by_id = {item.question_no: item for item in pending}
+    if response:
+        for entry in _parse_batch_evaluations(response):
+            try:
+                item = by_id.get(int(entry.get("id")))
+            except (TypeError, ValueError):
+                continue
+            evaluation = _validate_batch_entry(entry)
+            if item is not None and evaluation:
+                item.evaluation = evaluation
+
+    fallback_progress = None
+    if on_progress is not None:
+        batch_done = sum(1 for item in pending if item.evaluation)
+        on_progress(batch_done, len(pending))
+
+        def fallback_progress(done, total):
+            # Counted on top of what the batch already evaluated
+            on_progress(batch_done + done, len(pending))
+
+    # Anything the batch did not cover falls back to per-question calls
+    return evaluate_history(
+        history,
+        role=role,
+        experience=experience,
+        skills=skills,
+        max_workers=max_workers,
+        on_progress=fallback_progress,
+    )
+
+
+def _parse_batch_evaluations(response: str) -> list:
+    """
+    Returns the evaluation objects found in a batch response. If the JSON is
+    malformed or cut off, every complete object that can still be decoded
+    is returned.
+    """
+    try:
+        data = json.loads(response)
+        entries = data.get("evaluations") if isinstance(data, dict) else None
+        if isinstance(entries, list):
+            return [e for e in entries if isinstance(e, dict)]
+    except json.JSONDecodeError:
+        pass
+
+    decoder = json.JSONDecoder()
+    entries = []
+    for match in re.finditer(r"\{\s*\"id\"", response):
+        try:
+            obj, _ = decoder.raw_decode(response, match.start())
+        except json.JSONDecodeError:
+            continue
+        if isinstance(obj, dict):
+            entries.append(obj)
+    return entries
+
+
+def _validate_batch_entry(entry: dict) -> str:
+    """
+    Converts one batch entry into the EVALUATOR_SYSTEM text layout, or returns
+    "" if it does not match the schema.
+    """
+    score = entry.get("score")
+    if isinstance(score, bool) or not isinstance(score, int) or not 1 <= score <= 10:
+        return ""
+    for section in BATCH_SECTIONS:
+        value = entry.get(section)
+        if not isinstance(value, str) or not value.strip():
+            return ""
+
+    return (
+        f"SCORE: {score}\n\n"
+        f"STRENGTHS:\n{entry['strengths'].strip()}\n\n"
+        f"WEAKNESSES:\n{entry['weaknesses'].strip()}\n\n"
+        f"IMPROVEMENT_TIPS:\n{entry['improvement_tips'].strip()}"
+    )
+
+# ---------- Helper: generate final summary ----------
+SUMMARY_MODE = os.getenv("SUMMARY_MODE", "full")  # "full" or "compact"
+SUMMARY_TOKEN_BUDGET = int(os.getenv("SUMMARY_TOKEN_BUDGET", "1500"))
+
+
+class RollingSummary:
+    """
+    Compact digest of the interview history for the summary prompt. Each
+    evaluated question is reduced to its score plus short strengths and
+    weaknesses. Call update() as evaluations finish; render() keeps the text
+    within token_budget by clipping snippets harder and, if needed, folding
+    the oldest questions into a single score line.
+    """
+
+    SNIPPET_WIDTHS = (240, 160, 100, 60)
+
+    def __init__(self, token_budget: int = SUMMARY_TOKEN_BUDGET):
+        self.token_budget = token_budget
+        self._entries = {}  # question_no -> compacted entry
+
+    def update(self, history: list) -> "RollingSummary":
+        for item in history:
+            if item.question_no in self._entries:
+                continue
+            if item.skipped:
+                entry = {"question": item.question, "score": -1, "skipped": True}
+            elif not item.evaluation:
+                continue  # not evaluated yet
+            else:
+                sections = item.sections
+                entry = {
+                    "question": item.question,
+                    "score": item.score,
+                    "skipped": False,
+                    "strengths": sections["strengths"],
+                    "weaknesses": sections["weaknesses"],
+                }
+            self._entries[item.question_no] = entry
+        return self
+
+    def render(self) -> str:
+        numbers = sorted(self._entries)
+        for folded in range(len(numbers) + 1):
+            for width in self.SNIPPET_WIDTHS:
+                text = self._render(numbers[:folded], numbers[folded:], width)
+                if len(text) // 4 <= self.token_budget:
+                    return text
+        return text
+
+    def _render(self, folded: list, shown: list, width: int) -> str:
+        lines = []
+        if folded:
+            scores = [self._entries[n]["score"] for n in folded if self._entries[n]["score"] >= 0]
+            skipped = sum(1 for n in folded if self._entries[n]["skipped"])
+            average = f"{sum(scores) / len(scores):.1f}/10" if scores else "n/a"
+            lines.append(
+                f"Questions {folded[0]}-{folded[-1]} (condensed): average score {average}, "
+                f"{len(scores)} scored, {skipped} skipped."
+            )
+        for n in shown:
+            entry = self._entries[n]
+            if entry["skipped"]:
+                lines.append(f"Q{n}: {_clip(entry['question'], width)}\n  Skipped by interviewer.")
+                continue
+            score = f"{entry['score']}/10" if entry["score"] >= 0 else "not scored"
+            lines.append(
+                f"Q{n} [score {score}]: {_clip(entry['question'], width)}\n"
+                f"  Strengths: {_clip(entry['strengths'], width) or '-'}\n"
+                f"  Weaknesses: {_clip(entry['weaknesses'], width) or '-'}"
+            )
+        return "\n".join(lines)
+
+
+def _clip(text: str, width: int) -> str:
+    text = " ".join(text.replace("\n- ", "; ").lstrip("- ").split())
+    return text if len(text) <= width else text[: width - 1].rstrip() + "…"
+
+def generate_summary(
+    candidate_name: str,
+    role: str,
+    experience: str,
+    skills: str,
+    history: list,
+    mode: str = SUMMARY_MODE,
+    rolling: RollingSummary = None,
+) -> str:
+    """
+    mode="compact" sends a RollingSummary digest instead of every full
+    answer and evaluation; pass the rolling summary kept up to date during
+    evaluation to reuse it.
+    """
+    summary = call_groq(
+        SUMMARY_SYSTEM,
+        _summary_prompt(candidate_name, role, experience, skills, history, mode, rolling),
+        temperature=0.4,
+        max_tokens=800,
+        purpose="summary",
+    )
+    return summary.strip()
+
+
+def stream_summary(
+    candidate_name: str,
+    role: str,
+    experience: str,
+    skills: str,
+    history: list,
+    mode: str = SUMMARY_MODE,
+    rolling: RollingSummary = None,
+):
+    """
+    Same as generate_summary() but yields the report as it is generated,
+    e.g. for st.write_stream().
+    """
+    yield from stream_groq(
+        SUMMARY_SYSTEM,
+        _summary_prompt(candidate_name, role, experience, skills, history, mode, rolling),
+        temperature=0.4,
+        max_tokens=800,
+        purpose="summary",
+    )
+
+
+def _summary_prompt(
+    candidate_name: str,
+    role: str,
+    experience: str,
+    skills: str,
+    history: list,
+    mode: str = SUMMARY_MODE,
+    rolling: RollingSummary = None,
+) -> str:
+    if mode == "compact":
+        rolling = (rolling or RollingSummary()).update(history)
+        history_text = (
+            "(Condensed: per-question score with key strengths and weaknesses.)\n"
+            + rolling.render()
+        )
+    else:
+        history_text = "".join(
+            f"""
+Question {i}: {item.question}
+Candidate answer: {item.answer}
+Evaluation:
+{item.evaluation}
+
+-----------------------------
+"""
+            for i, item in enumerate(history, start=1)
+        )
+
+    return f"""
+Candidate name: {candidate_name}
+Job role: {role}
+Experience level: {experience}
+Key skills / technologies: {skills}
+
+Interview history:
+{history_text}
+
+Task:
+Provide an overall interview summary and recommendation.
+"""
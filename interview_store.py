@@ -0,0 +1,346 @@
+import os
+import sqlite3
+import threading
+import time
+
+# ---------- Config ----------
+INTERVIEW_STORE_PATH = os.getenv("INTERVIEW_STORE_PATH", "interviews.sqlite3")  # empty = disabled
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS candidates_name ON candidates (name);
+
+CREATE TABLE IF NOT EXISTS interviews (
+    id INTEGER PRIMARY KEY,
+    candidate_id INTEGER NOT NULL REFERENCES candidates (id),
+    source_id TEXT,
+    role TEXT NOT NULL,
+    experience TEXT NOT NULL,
+    interview_type TEXT NOT NULL,
+    skills TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    question_count INTEGER NOT NULL,
+    answered_count INTEGER NOT NULL,
+    avg_score REAL
+);
+CREATE INDEX IF NOT EXISTS interviews_created_at ON interviews (created_at);
+-- Covers the per-role aggregates as well as role + date filters
+CREATE INDEX IF NOT EXISTS interviews_role_created_at ON interviews (role, created_at, avg_score);
+CREATE INDEX IF NOT EXISTS interviews_avg_score ON interviews (avg_score);
+CREATE INDEX IF NOT EXISTS interviews_candidate ON interviews (candidate_id);
+
+CREATE TABLE IF NOT EXISTS questions (
+    interview_id INTEGER NOT NULL REFERENCES interviews (id) ON DELETE CASCADE,
+    question_no INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    PRIMARY KEY (interview_id, question_no)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS answers (
+    interview_id INTEGER NOT NULL,
+    question_no INTEGER NOT NULL,
+    answer TEXT NOT NULL,
+    skipped INTEGER NOT NULL,
+    PRIMARY KEY (interview_id, question_no),
+    FOREIGN KEY (interview_id, question_no) REFERENCES questions ON DELETE CASCADE
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS scores (
+    interview_id INTEGER NOT NULL,
+    question_no INTEGER NOT NULL,
+    score INTEGER,
+    evaluation TEXT NOT NULL,
+    PRIMARY KEY (interview_id, question_no),
+    FOREIGN KEY (interview_id, question_no) REFERENCES questions ON DELETE CASCADE
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS summaries (
+    interview_id INTEGER PRIMARY KEY REFERENCES interviews (id) ON DELETE CASCADE,
+    summary TEXT NOT NULL
+);
+"""
+
+# Columns added since the first schema: (table, column, type). Older store
+# files get them through ALTER TABLE when opened.
+ADDED_COLUMNS = (("interviews", "source_id", "TEXT"),)
+INDEXES = """
+CREATE INDEX IF NOT EXISTS interviews_source ON interviews (source_id);
+"""
+
+# Columns the interview list may be sorted by (all indexed)
+SORT_COLUMNS = {
+    "newest": "i.created_at DESC, i.id DESC",
+    "oldest": "i.created_at ASC, i.id ASC",
+    "highest score": "i.avg_score DESC, i.id DESC",
+    "lowest score": "i.avg_score ASC, i.id ASC",
+}
+
+
+def _filters(role=None, date_from=None, date_to=None, min_score=None) -> tuple:
+    """
+    WHERE clause and parameters shared by the list and aggregate queries.
+    """
+    clauses = []
+    params = []
+    if role:
+        clauses.append("i.role = ?")
+        params.append(role)
+    if date_from is not None:
+        clauses.append("i.created_at >= ?")
+        params.append(date_from)
+    if date_to is not None:
+        clauses.append("i.created_at < ?")
+        params.append(date_to)
+    if min_score is not None:
+        clauses.append("i.avg_score >= ?")
+        params.append(min_score)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+class InterviewStore:
+    """
+    Persistent SQLite (WAL mode) store of finished interviews for the HR
+    dashboard. Per-interview aggregates are stored on the interviews row
+    so list and dashboard queries never touch the question tables.
+    Safe to share between threads.
+    """
+
+    def __init__(self, path: str = INTERVIEW_STORE_PATH):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+        for table, column, type_ in ADDED_COLUMNS:
+            columns = {row["name"] for row in self._conn.execute(f"PRAGMA table_info({table})")}
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {type_}")
+        self._conn.executescript(INDEXES)
+        self._conn.commit()
+
+    def save_interview(
+        self,
+        candidate_name: str,
+        role: str,
+        experience: str,
+        interview_type: str,
+        skills: str,
+        history: list,
+        summary: str,
+        created_at: float = None,
+        source_id: str = None,
+        replace: bool = False,
+    ) -> int:
+        """
+        Stores one finished interview (history as a list of
+        history.HistoryItem) and returns its id. source_id is the app or API
+        session the interview came from; an existing candidate is reused
+        only for the same name from the same source, so different people
+        who share a name are kept apart. With replace, interviews already
+        stored under source_id are replaced by this one instead of kept.
+        """
+        created_at = time.time() if created_at is None else created_at
+        scores = [item.score for item in history if item.score >= 0]
+        avg_score = sum(scores) / len(scores) if scores else None
+        answered = sum(1 for item in history if not item.skipped)
+
+        with self._lock, self._conn:
+            row = None
+            if source_id is not None:
+                row = self._conn.execute(
+                    "SELECT c.id FROM candidates c JOIN interviews i ON i.candidate_id = c.id "
+                    "WHERE i.source_id = ? AND c.name = ? LIMIT 1",
+                    (source_id, candidate_name),
+                ).fetchone()
+            replaced = []
+            if replace and source_id is not None:
+                replaced = self._conn.execute(
+                    "SELECT id, candidate_id FROM interviews WHERE source_id = ?", (source_id,)
+                ).fetchall()
+                self._conn.executemany("DELETE FROM interviews WHERE id = ?", [(r["id"],) for r in replaced])
+            if row is None:
+                candidate_id = self._conn.execute(
+                    "INSERT INTO candidates (name, created_at) VALUES (?, ?)",
+                    (candidate_name, created_at),
+                ).lastrowid
+            else:
+                candidate_id = row["id"]
+
+            interview_id = self._conn.execute(
+                "INSERT INTO interviews (candidate_id, source_id, role, experience, interview_type, skills, "
+                "created_at, question_count, answered_count, avg_score) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    candidate_id, source_id, role, experience, interview_type, skills,
+                    created_at, len(history), answered, avg_score,
+                ),
+            ).lastrowid
+            self._conn.executemany(
+                "INSERT INTO questions (interview_id, question_no, question) VALUES (?, ?, ?)",
+                [(interview_id, item.question_no, item.question) for item in history],
+            )
+            self._conn.executemany(
+                "INSERT INTO answers (interview_id, question_no, answer, skipped) VALUES (?, ?, ?, ?)",
+                [
+                    (interview_id, item.question_no, item.answer, item.skipped)
+                    for item in history
+                ],
+            )
+            self._conn.executemany(
+                "INSERT INTO scores (interview_id, question_no, score, evaluation) VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        interview_id,
+                        item.question_no,
+                        item.score if item.score >= 0 else None,
+                        item.evaluation,
+                    )
+                    for item in history
+                ],
+            )
+            self._conn.execute(
+                "INSERT INTO summaries (interview_id, summary) VALUES (?, ?)",
+                (interview_id, summary),
+            )
+            # Candidates left without interviews by the replacement
+            self._conn.executemany(
+                "DELETE FROM candidates WHERE id = ? "
+                "AND NOT EXISTS (SELECT 1 FROM interviews WHERE candidate_id = candidates.id)",
+                [(r["candidate_id"],) for r in replaced],
+            )
+        return interview_id
+
+    def list_interviews(
+        self,
+        role: str = None,
+        date_from: float = None,
+        date_to: float = None,
+        min_score: float = None,
+        sort: str = "newest",
+        page: int = 1,
+        page_size: int = 25,
+    ) -> tuple:
+        """
+        One page of interviews matching the filters, plus the total number of
+        matches: ([row dict, ...], total).
+        """
+        where, params = _filters(role, date_from, date_to, min_score)
+        with self._lock:
+            total = self._conn.execute(
+                f"SELECT COUNT(*) FROM interviews i {where}", params
+            ).fetchone()[0]
+            rows = self._conn.execute(
+                "SELECT i.id, c.name AS candidate_name, i.role, i.experience, i.interview_type, "
+                "i.created_at, i.question_count, i.answered_count, i.avg_score "
+                f"FROM interviews i JOIN candidates c ON c.id = i.candidate_id {where} "
+                f"ORDER BY {SORT_COLUMNS[sort]} LIMIT ? OFFSET ?",
+                [*params, page_size, (max(page, 1) - 1) * page_size],
+            ).fetchall()
+        return [dict(row) for row in rows], total
+
+    def overview(
+        self, role: str = None, date_from: float = None, date_to: float = None, min_score: float = None
+    ) -> dict:
+        """
+        Totals for the filtered interviews: count, average score and
+        answered / asked questions.
+        """
+        where, params = _filters(role, date_from, date_to, min_score)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) AS interviews, AVG(i.avg_score) AS avg_score, "
+                "SUM(i.answered_count) AS answered, SUM(i.question_count) AS questions "
+                f"FROM interviews i {where}",
+                params,
+            ).fetchone()
+        return dict(row)
+
+    def role_stats(self, date_from: float = None, date_to: float = None, limit: int = 50) -> list:
+        """
+        Per-role interview count and score spread, most interviewed roles first.
+        """
+        where, params = _filters(date_from=date_from, date_to=date_to)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT i.role, COUNT(*) AS interviews, AVG(i.avg_score) AS avg_score, "
+                "MIN(i.avg_score) AS min_score, MAX(i.avg_score) AS max_score "
+                f"FROM interviews i {where} GROUP BY i.role "
+                "ORDER BY interviews DESC, i.role LIMIT ?",
+                [*params, limit],
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def daily_stats(self, role: str = None, date_from: float = None, date_to: float = None) -> list:
+        """
+        Interview count and average score per (local) day, oldest first.
+        """
+        where, params = _filters(role, date_from, date_to)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date(i.created_at, 'unixepoch', 'localtime') AS day, COUNT(*) AS interviews, "
+                "AVG(i.avg_score) AS avg_score "
+                f"FROM interviews i {where} GROUP BY day ORDER BY day",
+                params,
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def roles(self) -> list:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT role FROM interviews ORDER BY role"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_interview(self, interview_id: int):
+        """
+        One interview with its history (dicts of question_no, question,
+        answer, evaluation and score) and summary, or None.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT i.*, c.name AS candidate_name, s.summary "
+                "FROM interviews i JOIN candidates c ON c.id = i.candidate_id "
+                "LEFT JOIN summaries s ON s.interview_id = i.id WHERE i.id = ?",
+                (interview_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            items = self._conn.execute(
+                "SELECT q.question_no, q.question, a.answer, sc.evaluation, sc.score "
+                "FROM questions q "
+                "JOIN answers a USING (interview_id, question_no) "
+                "JOIN scores sc USING (interview_id, question_no) "
+                "WHERE q.interview_id = ? ORDER BY q.question_no",
+                (interview_id,),
+            ).fetchall()
+
+        interview = dict(row)
+        interview["history"] = [
+            {**dict(item), "score": -1 if item["score"] is None else item["score"]}
+            for item in items
+        ]
+        return interview
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """
+    The process-wide store, opened on first use; None when
+    INTERVIEW_STORE_PATH is empty.
+    """
+    global _store
+    if _store is None and INTERVIEW_STORE_PATH:
+        with _store_lock:
+            if _store is None:
+                _store = InterviewStore(INTERVIEW_STORE_PATH)
+    return _store
@@ -0,0 +1,415 @@
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+
+import groq
+import httpx
+from dotenv import load_dotenv
+from groq import Groq
+
+from llm_cache import CACHE_PATH, ResponseCache, cache_key
+from llm_router import LLM_HEDGE_THREADS, Router
+from llm_singleflight import SingleFlight
+from llm_scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    RateLimiter,
+    estimate_tokens,
+)
+from telemetry import telemetry
+from llm_transport import (
+    LLM_DEADLINE_SECONDS,
+    LLM_KEEPALIVE_SECONDS,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE,
+    LLM_MAX_RETRIES,
+    LLM_TIMEOUT_SECONDS,
+    CircuitBreaker,
+    LLMConfigError,
+    LLMConnectionError,
+    LLMError,
+    LLMRateLimitError,
+    LLMRequestError,
+    LLMServerError,
+    LLMTimeoutError,
+    backoff_delay,
+    retry_after_seconds,
+)
+
+# ---------- Load API key ----------
+load_dotenv(override=True)
+API_KEY = os.getenv("GROQ_API_KEY")
+
+# One pooled, keep-alive HTTP client shared by every session in the process.
+# Retries are handled by _create_completion(), not by the SDK.
+client = None
+if API_KEY:
+    client = Groq(
+        api_key=API_KEY,
+        max_retries=0,
+        timeout=LLM_TIMEOUT_SECONDS,
+        http_client=httpx.Client(
+            timeout=LLM_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_KEEPALIVE,
+                keepalive_expiry=LLM_KEEPALIVE_SECONDS,
+            ),
+        ),
+    )
+
+# Per-task models, limits and hedging
+router = Router()
+_hedge_pool = ThreadPoolExecutor(max_workers=LLM_HEDGE_THREADS, thread_name_prefix="llm-hedge")
+
+# Shared response cache; set LLM_CACHE_PATH to an empty string to disable it
+response_cache = ResponseCache(CACHE_PATH) if CACHE_PATH else None
+
+# Shared circuit breaker for the Groq API
+breaker = CircuitBreaker()
+
+# Process-wide RPM/TPM budget shared by every session
+limiter = RateLimiter()
+
+# Identical requests already in flight are shared instead of re-sent
+inflight = SingleFlight()
+
+# ---------- Helper: map SDK exceptions to typed errors ----------
+def _to_llm_error(exc: Exception) -> LLMError:
+    if isinstance(exc, groq.APITimeoutError):
+        return LLMTimeoutError(f"Model call timed out: {exc}")
+    if isinstance(exc, groq.APIConnectionError):
+        return LLMConnectionError(f"Could not reach the model API: {exc}")
+    if isinstance(exc, groq.APIStatusError):
+        retry_after = retry_after_seconds(exc.response.headers)
+        if exc.status_code == 429:
+            return LLMRateLimitError(f"Rate limited by the model API: {exc}", retry_after)
+        if exc.status_code >= 500:
+            return LLMServerError(f"Model API error {exc.status_code}: {exc}", retry_after)
+        return LLMRequestError(f"Model API rejected the request ({exc.status_code}): {exc}")
+    return LLMError(f"Error while calling model: {exc}")
+
+
+def _seconds(value: float) -> str:
+    """
+    e.g. 30 -> "30s", 0.25 -> "0.25s" (hedged attempts get sub-second deadlines).
+    """
+    return f"{value:.2f}".rstrip("0").rstrip(".") + "s"
+
+# ---------- Helper: one completion with retries ----------
+def _create_completion(
+    deadline: float = LLM_DEADLINE_SECONDS,
+    priority: int = PRIORITY_BACKGROUND,
+    stats: dict = None,
+    purpose: str = None,
+    sent: threading.Event = None,
+    **params,
+):
+    """
+    Calls chat.completions.create() through the circuit breaker and the
+    shared rate limiter, retrying timeouts, connection errors, 429 and 5xx
+    with jittered exponential backoff (honoring Retry-After) until
+    LLM_MAX_RETRIES or the deadline runs out. Time spent waiting for rate
+    limit budget and the number of retries are added to `stats` if given.
+    With a purpose, the latency of the successful (non-streaming) attempt
+    is reported to the router; `sent` is set once a request goes out.
+    """
+    if stats is None:
+        stats = {}
+    stats.setdefault("queue_time", 0.0)
+    stats.setdefault("retries", 0)
+    if client is None:
+        raise LLMConfigError("GROQ_API_KEY is not set. Please configure it before using the app.")
+
+    system_prompt, user_prompt = (m["content"] for m in params["messages"])
+    estimated = estimate_tokens(system_prompt, user_prompt, params["max_tokens"])
+    give_up_at = time.monotonic() + deadline
+    attempt = 0
+    while True:
+        breaker.before_call()
+        try:
+            try:
+                stats["queue_time"] += limiter.acquire(
+                    estimated,
+                    priority=priority,
+                    timeout=max(0.0, give_up_at - time.monotonic()),
+                )
+            except TimeoutError as exc:
+                raise LLMTimeoutError(
+                    f"Model call exceeded its {_seconds(deadline)} deadline waiting for rate limit budget."
+                ) from exc
+            remaining = give_up_at - time.monotonic()
+            if remaining <= 0:
+                limiter.settle(estimated, 0)
+                raise LLMTimeoutError(f"Model call exceeded its {_seconds(deadline)} deadline.")
+        except BaseException:
+            # Nothing was sent, so a half-open probe must not stay claimed
+            breaker.release_probe()
+            raise
+        sent_at = time.monotonic()
+        if sent is not None:
+            sent.set()
+        try:
+            response = client.chat.completions.create(
+                timeout=min(LLM_TIMEOUT_SECONDS, remaining),
+                **params,
+            )
+        except Exception as exc:
+            error = _to_llm_error(exc)
+            # Throttling and bad requests say nothing about API health
+            if isinstance(error, (LLMTimeoutError, LLMConnectionError, LLMServerError)):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            if not error.retryable or attempt >= LLM_MAX_RETRIES:
+                raise error from exc
+            delay = backoff_delay(attempt, getattr(error, "retry_after", None))
+            if time.monotonic() + delay >= give_up_at:
+                raise error from exc
+            time.sleep(delay)
+            attempt += 1
+            stats["retries"] = attempt
+            continue
+        breaker.record_success()
+        if purpose is not None and not params.get("stream"):
+            router.observe(purpose, params["model"], time.monotonic() - sent_at)
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            limiter.settle(estimated, usage.total_tokens)
+        return response
+
+
+def _hedged_completion(
+    hedge_after: float,
+    deadline: float = LLM_DEADLINE_SECONDS,
+    priority: int = PRIORITY_BACKGROUND,
+    stats: dict = None,
+    purpose: str = None,
+    **params,
+):
+    """
+    _create_completion() that sends a duplicate request if the first has not
+    answered within hedge_after seconds and returns whichever succeeds
+    first; the slower one finishes in the background and is discarded.
+    `stats` gets the winner's numbers plus hedged=True if a duplicate was sent.
+    """
+    started = time.monotonic()
+
+    def attempt(budget: float, sent: threading.Event = None):
+        attempt_stats = {}
+        response = _create_completion(
+            deadline=budget, priority=priority, stats=attempt_stats, purpose=purpose, sent=sent, **params
+        )
+        return response, attempt_stats
+
+    sent = threading.Event()
+    first = _hedge_pool.submit(contextvars.copy_context().run, attempt, deadline, sent)
+    first.add_done_callback(lambda _: sent.set())
+    pending = {first}
+    # The hedge clock starts when the first request goes out, so time spent
+    # queued for rate limit budget never triggers a duplicate
+    sent.wait(deadline)
+    done, _ = wait(pending, timeout=hedge_after)
+    budget = deadline - (time.monotonic() - started)
+    if not done and budget > 0:
+        pending.add(_hedge_pool.submit(contextvars.copy_context().run, attempt, budget))
+    hedged = len(pending) > 1
+
+    error = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                response, attempt_stats = future.result()
+            except LLMError as e:
+                error = e
+                continue
+            if stats is not None:
+                stats.update(attempt_stats, hedged=hedged)
+            return response
+    raise error
+
+# ---------- Helper: call Groq ----------
+def call_groq(
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float = 0.7,
+    max_tokens: int = 2000,
+    use_cache: bool = True,
+    json_mode: bool = False,
+    deadline: float = LLM_DEADLINE_SECONDS,
+    priority: int = PRIORITY_BACKGROUND,
+    purpose: str = "other",
+    coalesce: bool = None,
+) -> str:
+    """
+    Sends one chat completion to Groq. Identical requests are answered from
+    the response cache unless use_cache is False. json_mode asks the model
+    for a single JSON object. Use PRIORITY_INTERACTIVE for calls a user is
+    actively waiting on so they are scheduled ahead of background work.
+    `purpose` tags the call in telemetry (skills, question, evaluation, ...).
+    With coalesce (default: same as use_cache) a caller whose request is
+    identical to one already in flight waits for that response instead of
+    sending its own; errors reach every waiter.
+    Raises an LLMError subclass if the call ultimately fails.
+    """
+    started = time.monotonic()
+    route = router.route(purpose)
+    model = route.model
+    temperature, max_tokens = route.apply(temperature, max_tokens)
+    key = None
+    if use_cache and response_cache is not None:
+        key = cache_key(model, system_prompt, user_prompt, temperature, max_tokens)
+        cached = response_cache.get(key)
+        if cached is not None:
+            telemetry.record(purpose, model, time.monotonic() - started, cache_hit=True)
+            return cached
+
+    def fetch() -> str:
+        """
+        The uncached, uncoalesced request, with retries and telemetry.
+        Hedged routes get a duplicate request once this one runs slow.
+        """
+        extra = {"response_format": {"type": "json_object"}} if json_mode else {}
+        hedge_after = router.hedge_after(purpose)
+        if hedge_after is None:
+            create = _create_completion
+        else:
+            create = partial(_hedged_completion, hedge_after)
+        stats = {}
+        try:
+            response = create(
+                deadline=deadline,
+                priority=priority,
+                stats=stats,
+                purpose=purpose,
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **extra,
+            )
+        except LLMError as e:
+            telemetry.record(
+                purpose, model, time.monotonic() - started, error=type(e).__name__, **stats
+            )
+            raise
+        content = response.choices[0].message.content or ""
+        usage = getattr(response, "usage", None)
+        telemetry.record(
+            purpose,
+            model,
+            time.monotonic() - started,
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0,
+            **stats,
+        )
+
+        if key is not None and content:
+            response_cache.set(key, content)
+        return content
+
+    if coalesce is None:
+        coalesce = use_cache
+    if not coalesce:
+        return fetch()
+
+    # Whitespace-insensitive, so prompts built from slightly different
+    # form input (e.g. a trailing space in the role) still share a call
+    flight_key = (
+        model,
+        " ".join(system_prompt.split()),
+        " ".join(user_prompt.split()),
+        temperature,
+        max_tokens,
+        json_mode,
+    )
+    content, shared = inflight.do(
+        flight_key, fetch, timeout=max(0.0, deadline - (time.monotonic() - started))
+    )
+    if shared:
+        telemetry.record(purpose, model, time.monotonic() - started, coalesced=True)
+    return content
+
+# ---------- Helper: stream from Groq ----------
+def stream_groq(
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float = 0.7,
+    max_tokens: int = 2000,
+    use_cache: bool = True,
+    deadline: float = LLM_DEADLINE_SECONDS,
+    priority: int = PRIORITY_BACKGROUND,
+    purpose: str = "other",
+):
+    """
+    Streaming variant of call_groq(): yields the completion piece by piece as
+    tokens arrive. The assembled text is cached like a normal call.
+    Only opening the stream is retried; a failure mid-stream raises an LLMError.
+    Streams use the task's route but are never hedged. The rate limiter
+    reservation is settled with the usage reported on the last chunk.
+    """
+    started = time.monotonic()
+    route = router.route(purpose)
+    model = route.model
+    temperature, max_tokens = route.apply(temperature, max_tokens)
+    key = None
+    if use_cache and response_cache is not None:
+        key = cache_key(model, system_prompt, user_prompt, temperature, max_tokens)
+        cached = response_cache.get(key)
+        if cached is not None:
+            telemetry.record(purpose, model, time.monotonic() - started, cache_hit=True)
+            yield cached
+            return
+
+    stats = {}
+    parts = []
+    usage = None
+    try:
+        stream = _create_completion(
+            deadline=deadline,
+            priority=priority,
+            stats=stats,
+            model=model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+        try:
+            for chunk in stream:
+                # Groq reports usage on the last chunk under x_groq
+                usage = getattr(getattr(chunk, "x_groq", None), "usage", None) or usage
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as exc:
+            raise _to_llm_error(exc) from exc
+    except LLMError as e:
+        telemetry.record(
+            purpose, model, time.monotonic() - started, error=type(e).__name__, **stats
+        )
+        raise
+    if usage is not None:
+        limiter.settle(estimate_tokens(system_prompt, user_prompt, max_tokens), usage.total_tokens)
+    telemetry.record(
+        purpose,
+        model,
+        time.monotonic() - started,
+        prompt_tokens=usage.prompt_tokens if usage else 0,
+        completion_tokens=usage.completion_tokens if usage else 0,
+        **stats,
+    )
+
+    if key is not None and parts:
+        response_cache.set(key, "".join(parts))
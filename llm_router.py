@@ -0,0 +1,121 @@
+import json
+import os
+import threading
+from collections import deque
+
+# ---------- Config ----------
+LLM_MODEL = os.getenv("LLM_MODEL", "llama-3.1-8b-instant")  # model for routes that don't name one
+# Optional JSON overrides per task, e.g.
+# {"evaluation": {"model": "llama-3.3-70b-versatile", "temperature": 0.3, "max_tokens": 500}}
+LLM_ROUTES = os.getenv("LLM_ROUTES", "")
+LLM_HEDGE = os.getenv("LLM_HEDGE", "1") == "1"
+LLM_HEDGE_QUANTILE = float(os.getenv("LLM_HEDGE_QUANTILE", "0.95"))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+LLM_HEDGE_MIN_DELAY_SECONDS = float(os.getenv("LLM_HEDGE_MIN_DELAY_SECONDS", "0.5"))
+LLM_LATENCY_WINDOW = int(os.getenv("LLM_LATENCY_WINDOW", "200"))
+LLM_HEDGE_THREADS = int(os.getenv("LLM_HEDGE_THREADS", "32"))
+
+
+class Route:
+    """
+    How calls for one task are made. max_tokens caps what the caller asks
+    for and temperature replaces it; None keeps the caller's value. Hedged
+    routes send a second request when the first runs past the route's
+    usual (LLM_HEDGE_QUANTILE) latency.
+    """
+
+    def __init__(self, model: str = None, max_tokens: int = None, temperature: float = None, hedge: bool = False):
+        self.model = model or LLM_MODEL
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.hedge = hedge
+
+    def apply(self, temperature: float, max_tokens: int) -> tuple:
+        """
+        The (temperature, max_tokens) to send for a caller's values.
+        """
+        if self.temperature is not None:
+            temperature = self.temperature
+        if self.max_tokens is not None:
+            max_tokens = min(max_tokens, self.max_tokens)
+        return temperature, max_tokens
+
+
+# Interactive tasks (someone is waiting on them) are hedged; bulk
+# evaluation and summaries are not, so they never double their load
+DEFAULT_ROUTES = {
+    "skills": {"hedge": True},
+    "question": {"hedge": True},
+    "question_plan": {"hedge": True},
+    "evaluation": {},
+    "evaluation_batch": {},
+    "summary": {},
+    "question_bank": {},
+}
+
+
+def _load_routes() -> dict:
+    routes = {name: dict(options) for name, options in DEFAULT_ROUTES.items()}
+    if LLM_ROUTES:
+        for name, options in json.loads(LLM_ROUTES).items():
+            routes.setdefault(name, {}).update(options)
+    return {name: Route(**options) for name, options in routes.items()}
+
+
+class LatencyTracker:
+    """
+    Recent successful call latencies per (route, model), for hedging.
+    """
+
+    def __init__(self, window: int = LLM_LATENCY_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples = {}
+
+    def observe(self, key: tuple, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def quantile(self, key: tuple, q: float, min_samples: int = LLM_HEDGE_MIN_SAMPLES):
+        """
+        The q-quantile of the recent latencies, or None with too few samples.
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < max(1, min_samples):
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+class Router:
+    """
+    Maps each task (call_groq's `purpose`) to a Route and decides when a
+    call on a hedged route should get a backup request.
+    """
+
+    def __init__(self, routes: dict = None):
+        self.routes = _load_routes() if routes is None else routes
+        self.latency = LatencyTracker()
+        self._default = Route()
+
+    def route(self, purpose: str) -> Route:
+        return self.routes.get(purpose, self._default)
+
+    def observe(self, purpose: str, model: str, seconds: float) -> None:
+        self.latency.observe((purpose, model), seconds)
+
+    def hedge_after(self, purpose: str):
+        """
+        Seconds after which a call for this task gets a hedged duplicate, or
+        None when the route is not hedged or has too little history.
+        """
+        route = self.route(purpose)
+        if not (LLM_HEDGE and route.hedge):
+            return None
+        p = self.latency.quantile((purpose, route.model), LLM_HEDGE_QUANTILE)
+        if p is None:
+            return None
+        return max(p, LLM_HEDGE_MIN_DELAY_SECONDS)
@@ -0,0 +1,138 @@
+import heapq
+import itertools
+import os
+import threading
+import time
+
+# ---------- Config ----------
+GROQ_RPM_LIMIT = float(os.getenv("GROQ_RPM_LIMIT", "30"))  # 0 = unlimited
+GROQ_TPM_LIMIT = float(os.getenv("GROQ_TPM_LIMIT", "6000"))  # 0 = unlimited
+# Share of each budget that only interactive calls may dip into
+INTERACTIVE_RESERVE = float(os.getenv("LLM_INTERACTIVE_RESERVE", "0.2"))
+
+# Lower value = served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+
+def estimate_tokens(system_prompt: str, user_prompt: str, max_tokens: int) -> int:
+    """
+    Rough token cost of a request: ~4 characters per prompt token plus the
+    completion budget.
+    """
+    return (len(system_prompt) + len(user_prompt)) // 4 + max_tokens
+
+
+class TokenBucket:
+    """
+    Classic token bucket holding up to `capacity` units, refilled at
+    capacity / period units per second. Not thread-safe on its own.
+    """
+
+    def __init__(self, capacity: float, period: float = 60.0):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.level = capacity
+        self._updated = time.monotonic()
+
+    def refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, reserve: float = 0.0) -> float:
+        """
+        Seconds until `amount` can be taken while leaving `reserve` untouched.
+        """
+        missing = amount + reserve - self.level
+        return max(0.0, missing / self.rate)
+
+    def take(self, amount: float) -> None:
+        self.level -= amount
+
+    def give_back(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimiter:
+    """
+    Process-wide admission control for model calls. Every call needs one
+    request from the RPM bucket and its estimated tokens from the TPM bucket.
+    Waiting calls are admitted strictly by (priority, arrival), and background
+    calls cannot use the share of each budget reserved for interactive calls.
+    """
+
+    def __init__(
+        self,
+        rpm: float = GROQ_RPM_LIMIT,
+        tpm: float = GROQ_TPM_LIMIT,
+        interactive_reserve: float = INTERACTIVE_RESERVE,
+    ):
+        self.requests = TokenBucket(rpm) if rpm > 0 else None
+        self.tokens = TokenBucket(tpm) if tpm > 0 else None
+        self.interactive_reserve = interactive_reserve
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._seq = itertools.count()
+
+    def _wait_time(self, priority: int, tokens: float) -> float:
+        wait = 0.0
+        for bucket, amount in ((self.requests, 1), (self.tokens, tokens)):
+            if bucket is None:
+                continue
+            bucket.refill()
+            reserve = 0.0
+            if priority > PRIORITY_INTERACTIVE:
+                reserve = bucket.capacity * self.interactive_reserve
+            wait = max(wait, bucket.wait_time(min(amount, bucket.capacity - reserve), reserve))
+        return wait
+
+    def acquire(self, tokens: int, priority: int = PRIORITY_BACKGROUND, timeout: float = None) -> float:
+        """
+        Blocks until the call may be sent and returns the seconds spent queued.
+        Raises TimeoutError if it could not be admitted within `timeout` seconds.
+        """
+        if self.requests is None and self.tokens is None:
+            return 0.0
+
+        if self.tokens is not None:
+            tokens = min(tokens, self.tokens.capacity)
+        start = time.monotonic()
+        entry = (priority, next(self._seq))
+        with self._cond:
+            heapq.heappush(self._waiting, entry)
+            try:
+                while True:
+                    wait = 0.0
+                    if self._waiting[0] == entry:
+                        wait = self._wait_time(priority, tokens)
+                        if wait == 0.0:
+                            if self.requests is not None:
+                                self.requests.take(1)
+                            if self.tokens is not None:
+                                self.tokens.take(tokens)
+                            return time.monotonic() - start
+                    if timeout is not None:
+                        left = timeout - (time.monotonic() - start)
+                        if left <= 0:
+                            raise TimeoutError("Timed out waiting for model rate limit budget.")
+                        wait = min(wait or left, left)
+                    self._cond.wait(wait or None)
+            finally:
+                if entry in self._waiting:
+                    self._waiting.remove(entry)
+                    heapq.heapify(self._waiting)
+                self._cond.notify_all()
+
+    def settle(self, estimated: int, actual: int) -> None:
+        """
+        Returns unused tokens once the real usage of a call is known.
+        """
+        if self.tokens is None:
+            return
+        estimated = min(estimated, self.tokens.capacity)
+        if actual >= estimated:
+            return
+        with self._cond:
+            self.tokens.give_back(estimated - actual)
+            self._cond.notify_all()
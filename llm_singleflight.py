@@ -0,0 +1,61 @@
+import threading
+
+from llm_transport import LLMTimeoutError
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical calls that overlap in time: the first caller for a
+    key runs the function, later callers for the same key wait for its
+    result (or exception) instead of making their own call. Nothing is kept
+    once the call finishes; repeated calls are the response cache's job.
+    Safe to share between threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, timeout: float = None) -> tuple:
+        """
+        Returns (fn(), shared), where shared is True when the result came
+        from another caller's in-flight call. A waiter gives up with
+        LLMTimeoutError after `timeout` seconds; the call itself goes on.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise LLMTimeoutError(
+                    f"Timed out after {timeout:.0f}s waiting for an identical in-flight request."
+                )
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
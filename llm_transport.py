@@ -0,0 +1,152 @@
+import email.utils
+import os
+import random
+import threading
+import time
+
+# ---------- Config ----------
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "30"))
+LLM_DEADLINE_SECONDS = float(os.getenv("LLM_DEADLINE_SECONDS", "60"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+LLM_BACKOFF_BASE_SECONDS = float(os.getenv("LLM_BACKOFF_BASE_SECONDS", "0.5"))
+LLM_BACKOFF_MAX_SECONDS = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", "8"))
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "32"))
+LLM_MAX_KEEPALIVE = int(os.getenv("LLM_MAX_KEEPALIVE", "16"))
+LLM_KEEPALIVE_SECONDS = float(os.getenv("LLM_KEEPALIVE_SECONDS", "30"))
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("LLM_BREAKER_FAILURES", "5"))
+BREAKER_COOLDOWN_SECONDS = float(os.getenv("LLM_BREAKER_COOLDOWN_SECONDS", "30"))
+
+
+# ---------- Errors ----------
+class LLMError(Exception):
+    """Base class for every failure of a model call."""
+
+    retryable = False
+
+
+class LLMConfigError(LLMError):
+    """The client is not configured (e.g. GROQ_API_KEY missing)."""
+
+
+class LLMTimeoutError(LLMError):
+    """The call did not finish within its timeout or deadline."""
+
+    retryable = True
+
+
+class LLMConnectionError(LLMError):
+    """The API could not be reached."""
+
+    retryable = True
+
+
+class LLMRateLimitError(LLMError):
+    """The API answered 429 Too Many Requests."""
+
+    retryable = True
+
+    def __init__(self, message: str, retry_after: float = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class LLMServerError(LLMError):
+    """The API answered with a 5xx status."""
+
+    retryable = True
+
+    def __init__(self, message: str, retry_after: float = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class LLMRequestError(LLMError):
+    """The API rejected the request (4xx other than 429)."""
+
+
+class LLMCircuitOpenError(LLMError):
+    """Calls are failing fast because the API looks degraded."""
+
+
+# ---------- Helper: retry timing ----------
+def retry_after_seconds(headers) -> float:
+    """
+    Parses a Retry-After header (seconds or HTTP date). Returns None if absent.
+    """
+    if headers is None:
+        return None
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def backoff_delay(attempt: int, retry_after: float = None) -> float:
+    """
+    Full-jitter exponential backoff, never shorter than the server's Retry-After.
+    """
+    ceiling = min(LLM_BACKOFF_MAX_SECONDS, LLM_BACKOFF_BASE_SECONDS * (2 ** attempt))
+    delay = random.uniform(0, ceiling)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+# ---------- Circuit breaker ----------
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failures and rejects calls for
+    cooldown_seconds. After the cooldown one probe call is let through; its
+    outcome closes the breaker again or re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        cooldown_seconds: float = BREAKER_COOLDOWN_SECONDS,
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if time.monotonic() - self._opened_at < self.cooldown_seconds or self._probing:
+                raise LLMCircuitOpenError(
+                    "Model API is temporarily unavailable; failing fast. Please retry shortly."
+                )
+            self._probing = True
+
+    def release_probe(self) -> None:
+        """
+        Ends a probe that was let through but never sent, leaving the
+        breaker's state as it was so the next call can probe instead.
+        """
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
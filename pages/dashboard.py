@@ -0,0 +1,202 @@
+import datetime
+import io
+import zipfile
+
+import streamlit as st
+
+from interview_store import SORT_COLUMNS, get_store
+from report_export import MIME_TYPES, export_filename, start_export, stored_payload
+
+# ---------- Page config ----------
+st.set_page_config(
+    page_title="HR Dashboard – AI Interview Agent",
+    layout="wide",
+)
+
+st.markdown("## 📋 HR Dashboard")
+st.markdown(
+    "<p style='color:#4b5563;'>Every finished interview, filtered and aggregated in the database.</p>",
+    unsafe_allow_html=True,
+)
+
+store = get_store()
+if store is None:
+    st.warning("The interview store is disabled. Set INTERVIEW_STORE_PATH to enable it.")
+    st.stop()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def role_options() -> list:
+    return store.roles()
+
+
+# ---------- Report exports (rendered in the background, see report_export.py) ----------
+MAX_EXPORTS = 20  # per session; the least recently shown are dropped
+
+if "exports" not in st.session_state:
+    st.session_state.exports = {}  # key -> [(file name, future of bytes), ...], oldest first
+    st.session_state.export_zips = {}  # key -> ZIP of that export's files
+
+
+def start_exports(key: str, interviews: list) -> None:
+    files = []
+    for interview in interviews:
+        payload = stored_payload(interview)
+        for fmt, future in start_export(payload, tuple(MIME_TYPES)).items():
+            files.append((f"{interview['id']}_{export_filename(payload, fmt)}", future))
+    exports = st.session_state.exports
+    exports.pop(key, None)
+    st.session_state.export_zips.pop(key, None)
+    exports[key] = files
+    while len(exports) > MAX_EXPORTS:
+        oldest = next(iter(exports))
+        del exports[oldest]
+        st.session_state.export_zips.pop(oldest, None)
+        st.session_state.pop(f"polling_{oldest}", None)
+
+
+def export_downloads(key: str, zip_name: str = None) -> None:
+    """
+    Download buttons for one export: one per file, or a single ZIP of all
+    files when zip_name is given. Shown as a polling fragment while files
+    are still rendering.
+    """
+    files = st.session_state.exports[key]
+    ready = sum(future.done() for _, future in files)
+    if ready < len(files):
+        st.caption(f"⏳ Rendering reports... {ready} of {len(files)} files ready")
+        return
+    if st.session_state.pop(f"polling_{key}", False):
+        st.rerun()
+
+    results = []
+    for name, future in files:
+        try:
+            results.append((name, future.result()))
+        except Exception as e:
+            st.error(f"Export of {name} failed: {e}")
+
+    if zip_name is None:
+        cols = st.columns(max(1, len(results)))
+        for col, (name, data) in zip(cols, results):
+            fmt = name.rsplit(".", 1)[-1]
+            col.download_button(
+                f"⬇️ Download {fmt.upper()}", data, file_name=name, mime=MIME_TYPES[fmt], key=f"{key}_{fmt}"
+            )
+        return
+
+    if key not in st.session_state.export_zips:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name, data in results:
+                archive.writestr(name, data)
+        st.session_state.export_zips[key] = buffer.getvalue()
+    st.download_button(
+        f"⬇️ Download {len(results)} files (ZIP)",
+        st.session_state.export_zips[key],
+        file_name=zip_name,
+        mime="application/zip",
+        key=f"{key}_zip",
+    )
+
+
+def show_export(key: str, zip_name: str = None) -> None:
+    st.session_state.exports[key] = st.session_state.exports.pop(key)  # most recently shown last
+    polling = not all(future.done() for _, future in st.session_state.exports[key])
+    st.session_state[f"polling_{key}"] = polling
+    st.fragment(export_downloads, run_every=1.0 if polling else None)(key, zip_name)
+
+
+# ---------- Sidebar: filters ----------
+st.sidebar.header("🔎 Filters")
+role = st.sidebar.selectbox("Job role", ["All roles"] + role_options())
+role = None if role == "All roles" else role
+
+today = datetime.date.today()
+date_range = st.sidebar.date_input(
+    "Interview date",
+    value=(today - datetime.timedelta(days=30), today),
+)
+date_from = date_to = None
+if len(date_range) == 2:
+    start, end = date_range
+    date_from = datetime.datetime.combine(start, datetime.time()).timestamp()
+    date_to = datetime.datetime.combine(end + datetime.timedelta(days=1), datetime.time()).timestamp()
+
+min_score = st.sidebar.slider("Minimum average score", 0.0, 10.0, 0.0, 0.5)
+min_score = min_score or None
+sort = st.sidebar.selectbox("Sort by", list(SORT_COLUMNS))
+page_size = st.sidebar.selectbox("Rows per page", [25, 50, 100], index=0)
+
+# ---------- Overview ----------
+overview = store.overview(role, date_from, date_to, min_score)
+c1, c2, c3 = st.columns(3)
+c1.metric("Interviews", f"{overview['interviews']:,}")
+c2.metric(
+    "Average score",
+    f"{overview['avg_score']:.1f} / 10" if overview["avg_score"] is not None else "–",
+)
+c3.metric(
+    "Questions answered",
+    f"{overview['answered'] / overview['questions']:.0%}" if overview["questions"] else "–",
+)
+
+left_col, right_col = st.columns([1, 1])
+with left_col:
+    st.subheader("By role")
+    st.dataframe(store.role_stats(date_from, date_to), hide_index=True, use_container_width=True)
+with right_col:
+    st.subheader("Per day")
+    daily = store.daily_stats(role, date_from, date_to)
+    if daily:
+        st.bar_chart(daily, x="day", y="interviews")
+
+# ---------- Interviews (one page at a time) ----------
+st.subheader("Interviews")
+page = st.number_input("Page", min_value=1, value=1, step=1)
+rows, total = store.list_interviews(
+    role=role,
+    date_from=date_from,
+    date_to=date_to,
+    min_score=min_score,
+    sort=sort,
+    page=page,
+    page_size=page_size,
+)
+pages = max(1, -(-total // page_size))
+st.caption(f"Page {page} of {pages:,} – {total:,} matching interviews")
+
+for row in rows:
+    row["created_at"] = datetime.datetime.fromtimestamp(row["created_at"]).strftime("%Y-%m-%d %H:%M")
+    if row["avg_score"] is not None:
+        row["avg_score"] = round(row["avg_score"], 1)
+st.dataframe(rows, hide_index=True, use_container_width=True)
+
+if rows:
+    page_key = f"page:{role}:{date_from}:{date_to}:{min_score}:{sort}:{page_size}:{page}"
+    if st.button("📦 Export this page (PDF + JSON)"):
+        start_exports(page_key, [store.get_interview(row["id"]) for row in rows])
+    if page_key in st.session_state.exports:
+        show_export(page_key, zip_name=f"interviews_page_{page}.zip")
+
+# ---------- Interview details ----------
+if rows:
+    options = {f"#{row['id']} – {row['candidate_name']} ({row['role']})": row["id"] for row in rows}
+    choice = st.selectbox("Open interview", list(options))
+    interview = store.get_interview(options[choice])
+    if interview is not None:
+        with st.expander("Question-wise scores and evaluations", expanded=False):
+            for item in interview["history"]:
+                score = item["score"] if item["score"] >= 0 else "–"
+                st.markdown(f"**Q{item['question_no']}. {item['question']}** (score: {score})")
+                st.markdown(f"*Answer:* {item['answer']}")
+                st.markdown(item["evaluation"])
+                st.markdown("---")
+        st.markdown("#### 🧾 Final Interview Report")
+        st.markdown(interview["summary"] or "")
+
+        # created_at too: a replaced interview (save_interview(replace=True)) may reuse the id
+        interview_key = f"interview:{interview['id']}:{interview['created_at']}"
+        if interview_key not in st.session_state.exports:
+            start_exports(interview_key, [interview])
+        show_export(interview_key)
@@ -0,0 +1,392 @@
+"""
+Precomputed question bank served ahead of live question generation.
+
+Questions are generated offline in bulk for the role / experience / skill /
+interview type combinations used most often, near-duplicates are dropped
+with MinHash, and the rest are stored in a JSON file. At runtime the file is
+loaded once into an in-memory index so QuestionPrefetcher can serve a
+question without calling the model; live generation only happens on a miss.
+
+Build or extend the bank from a JSONL file of combinations, one per line:
+
+    {"role": "Python Developer", "experience": "Fresher",
+     "skills": "Python, SQL, Django", "interview_type": "Technical"}
+
+    python question_bank.py combos.jsonl --per-call 8 --workers 4
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from llm import LLMError, call_groq
+
+# ---------- Config ----------
+QUESTION_BANK_PATH = os.getenv("QUESTION_BANK_PATH", "question_bank.json")
+# Estimated Jaccard similarity (word 3-gram shingles) above which a new
+# question counts as a duplicate of one already in the bank
+QUESTION_BANK_DEDUP_THRESHOLD = float(os.getenv("QUESTION_BANK_DEDUP_THRESHOLD", "0.6"))
+
+ANY_SKILL = "*"
+# Interview types whose questions do not depend on the candidate's skills
+GENERAL_INTERVIEW_TYPES = {"hr / behavioral"}
+
+# Same progression generate_question() asks for
+DIFFICULTY_TIERS = {
+    "easy": "slightly easier and open-ended, suitable as question 1 or 2",
+    "medium": "more detailed, testing practical understanding",
+    "hard": "scenario-based or design questions for the end of the interview",
+}
+
+
+def difficulty_tier(question_no: int) -> str:
+    if question_no <= 2:
+        return "easy"
+    if question_no <= 5:
+        return "medium"
+    return "hard"
+
+
+def normalize_key(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+def split_skills(skills: str) -> list:
+    """
+    Normalized skill names from a comma / newline separated skills string.
+    """
+    seen = []
+    for skill in re.split(r"[,;\n]", skills):
+        skill = normalize_key(skill)
+        if skill and skill not in seen:
+            seen.append(skill)
+    return seen
+
+
+# ---------- MinHash near-duplicate detection ----------
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16
+_MERSENNE_PRIME = (1 << 61) - 1
+_minhash_rng = random.Random(1)
+_MINHASH_PARAMS = [
+    (_minhash_rng.randrange(1, _MERSENNE_PRIME), _minhash_rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(MINHASH_PERMUTATIONS)
+]
+
+
+def shingles(text: str, size: int = 3) -> set:
+    words = re.findall(r"\w+", text.casefold())
+    if len(words) <= size:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash(text: str) -> tuple:
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+        for s in shingles(text)
+    ]
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+        for a, b in _MINHASH_PARAMS
+    )
+
+
+def similarity(sig_a: tuple, sig_b: tuple) -> float:
+    """
+    Estimated Jaccard similarity of two MinHash signatures.
+    """
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+class DuplicateIndex:
+    """
+    LSH over MinHash signatures: only questions sharing at least one band
+    are compared, so adding stays fast as the bank grows.
+    """
+
+    def __init__(self, threshold: float = QUESTION_BANK_DEDUP_THRESHOLD):
+        self.threshold = threshold
+        self._buckets = {}
+        self._signatures = []
+
+    def _bands(self, signature: tuple):
+        rows = len(signature) // MINHASH_BANDS
+        for band in range(MINHASH_BANDS):
+            yield band, signature[band * rows:(band + 1) * rows]
+
+    def add(self, text: str) -> bool:
+        """
+        Adds text unless it is a near-duplicate of something already added.
+        Returns whether it was added.
+        """
+        signature = minhash(text)
+        candidates = set()
+        for band in self._bands(signature):
+            candidates.update(self._buckets.get(band, ()))
+        for i in candidates:
+            if similarity(signature, self._signatures[i]) >= self.threshold:
+                return False
+
+        idx = len(self._signatures)
+        self._signatures.append(signature)
+        for band in self._bands(signature):
+            self._buckets.setdefault(band, []).append(idx)
+        return True
+
+
+# ---------- Index ----------
+class QuestionBank:
+    """
+    Questions indexed by (role, experience, skill, interview type, tier).
+    Keys are normalized, so lookups ignore case and extra whitespace.
+    Near-duplicates are dropped per (role, experience, interview type)
+    unless check_duplicates is False, which skips the MinHash work for
+    entries that are already deduplicated.
+    """
+
+    def __init__(self, entries=(), check_duplicates: bool = True):
+        self._index = {}
+        self._dedup = {}
+        self._entries = []
+        self.check_duplicates = check_duplicates
+        for entry in entries:
+            self.add(**entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(
+        self,
+        role: str,
+        experience: str,
+        skill: str,
+        interview_type: str,
+        tier: str,
+        question: str,
+    ) -> bool:
+        question = question.strip()
+        if not question:
+            return False
+        role, experience, interview_type = (
+            normalize_key(role), normalize_key(experience), normalize_key(interview_type)
+        )
+        skill = normalize_key(skill) or ANY_SKILL
+        scope = (role, experience, interview_type)
+        if self.check_duplicates and not self._dedup.setdefault(scope, DuplicateIndex()).add(question):
+            return False
+
+        key = (role, experience, skill, interview_type, tier)
+        self._index.setdefault(key, []).append(question)
+        self._entries.append(
+            {
+                "role": role,
+                "experience": experience,
+                "skill": skill,
+                "interview_type": interview_type,
+                "tier": tier,
+                "question": question,
+            }
+        )
+        return True
+
+    def candidates(
+        self,
+        role: str,
+        experience: str,
+        skills: str,
+        interview_type: str,
+        question_no: int,
+    ) -> list:
+        role, experience, interview_type = (
+            normalize_key(role), normalize_key(experience), normalize_key(interview_type)
+        )
+        tier = difficulty_tier(question_no)
+        found = []
+        for skill in split_skills(skills) + [ANY_SKILL]:
+            found.extend(self._index.get((role, experience, skill, interview_type, tier), ()))
+        return found
+
+    def draw(
+        self,
+        role: str,
+        experience: str,
+        skills: str,
+        interview_type: str,
+        question_no: int,
+        exclude=(),
+        rng: random.Random = random,
+    ):
+        """
+        Returns a random bank question for these inputs that is not in
+        exclude, or None on a miss.
+        """
+        pool = [
+            q for q in self.candidates(role, experience, skills, interview_type, question_no)
+            if q not in exclude
+        ]
+        return rng.choice(pool) if pool else None
+
+    def save(self, path: str) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"questions": self._entries}, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, check_duplicates: bool = False) -> "QuestionBank":
+        """
+        The file was deduplicated when it was built, so by default its
+        entries are indexed without checking; pass check_duplicates=True to
+        add more questions afterwards.
+        """
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f)["questions"], check_duplicates=check_duplicates)
+
+
+_bank = None
+_bank_lock = threading.Lock()
+
+
+def get_bank() -> QuestionBank:
+    """
+    The process-wide bank, loaded from QUESTION_BANK_PATH on first use
+    (empty when the path is unset or missing). The app and the API call it
+    at startup so no interview waits for the load.
+    """
+    global _bank
+    if _bank is None:
+        with _bank_lock:
+            if _bank is None:
+                if QUESTION_BANK_PATH and os.path.exists(QUESTION_BANK_PATH):
+                    _bank = QuestionBank.load(QUESTION_BANK_PATH)
+                else:
+                    _bank = QuestionBank()
+    return _bank
+
+
+# ---------- Offline generation ----------
+BANK_GENERATOR_SYSTEM = """
+You are an expert technical interviewer and HR specialist.
+You write clear, concise interview questions.
+Always respond with a single JSON object of the form
+{"questions": ["question text", ...]} and nothing else.
+"""
+
+
+def generate_bank_questions(
+    role: str,
+    experience: str,
+    skill: str,
+    interview_type: str,
+    tier: str,
+    count: int,
+) -> list:
+    focus = (
+        "General questions for this role (not tied to one skill)"
+        if skill == ANY_SKILL
+        else f"Focus skill / technology: {skill}"
+    )
+    user_prompt = f"""
+Job role: {role}
+Experience level: {experience}
+{focus}
+Interview type: {interview_type}
+Difficulty: {DIFFICULTY_TIERS[tier]}
+
+Task:
+Write {count} different interview questions.
+
+Guidelines:
+- Each question must stand on its own and cover a different topic.
+- Do NOT include answers or any extra text.
+"""
+    response = call_groq(
+        BANK_GENERATOR_SYSTEM,
+        user_prompt,
+        temperature=0.9,
+        max_tokens=min(150 * count + 100, 4000),
+        use_cache=False,
+        json_mode=True,
+        purpose="question_bank",
+    )
+    try:
+        questions = json.loads(response).get("questions")
+    except (json.JSONDecodeError, AttributeError):
+        return []
+    if not isinstance(questions, list):
+        return []
+    return [q.strip() for q in questions if isinstance(q, str) and q.strip()]
+
+
+def read_combinations(path: str):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def build_jobs(combos) -> list:
+    jobs = []
+    for combo in combos:
+        interview_type = combo["interview_type"]
+        skills = (
+            [ANY_SKILL]
+            if normalize_key(interview_type) in GENERAL_INTERVIEW_TYPES
+            else split_skills(combo.get("skills", "")) + [ANY_SKILL]
+        )
+        for skill in skills:
+            for tier in DIFFICULTY_TIERS:
+                jobs.append((combo["role"], combo["experience"], skill, interview_type, tier))
+    return jobs
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build or extend the precomputed question bank.")
+    parser.add_argument("combos", help="JSONL of {role, experience, skills, interview_type}")
+    parser.add_argument("--output", default=QUESTION_BANK_PATH or "question_bank.json")
+    parser.add_argument("--per-call", type=int, default=8, help="questions requested per model call")
+    parser.add_argument("--rounds", type=int, default=1, help="model calls per skill and tier")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    bank = QuestionBank.load(args.output, check_duplicates=True) if os.path.exists(args.output) else QuestionBank()
+    before = len(bank)
+    jobs = build_jobs(read_combinations(args.combos)) * args.rounds
+
+    added = dropped = failed = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(generate_bank_questions, *job, count=args.per_call): job
+            for job in jobs
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            role, experience, skill, interview_type, tier = futures[future]
+            try:
+                questions = future.result()
+            except LLMError as e:
+                failed += 1
+                print(f"[{done}/{len(jobs)}] {role} / {skill} / {tier}: {e}", file=sys.stderr)
+                continue
+            for question in questions:
+                if bank.add(role, experience, skill, interview_type, tier, question):
+                    added += 1
+                else:
+                    dropped += 1
+            print(f"[{done}/{len(jobs)}] {role} / {skill} / {tier}: {len(questions)} questions", file=sys.stderr)
+
+    bank.save(args.output)
+    print(
+        f"{len(bank)} questions in {args.output} "
+        f"({len(bank) - before} new, {dropped} near-duplicates dropped, {failed} calls failed)"
+    )
+    return 1 if failed and not added else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
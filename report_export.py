@@ -0,0 +1,400 @@
+"""
+Report export: the final interview report (summary, per-question scores and
+evaluations) as PDF or JSON.
+
+Rendering runs in a background thread pool, so the UI never waits on it:
+start_export() returns one future per format. Artifacts are cached in
+EXPORT_CACHE_DIR under a hash of the report content, so downloading the same
+report again, from any worker, reads a file instead of rendering.
+
+Bulk export of stored interviews (interview_store.py), rendered in parallel
+worker processes:
+
+    python report_export.py exports/ --role "Data Analyst" --since 2024-01-01 --format pdf json
+"""
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from history import SECTIONS, HistoryItem
+
+# ---------- Config ----------
+EXPORT_CACHE_DIR = os.getenv("EXPORT_CACHE_DIR", ".report_exports")  # empty = no cache
+EXPORT_CACHE_MAX_FILES = int(os.getenv("EXPORT_CACHE_MAX_FILES", "5000"))
+EXPORT_WORKERS = int(os.getenv("EXPORT_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Bump when the rendered layout changes, so cached files are not reused
+EXPORT_LAYOUT_VERSION = 1
+MIME_TYPES = {"pdf": "application/pdf", "json": "application/json"}
+
+_pool = None
+_pool_lock = threading.Lock()
+_in_flight = {}  # (content hash, format) -> Future
+_in_flight_lock = threading.Lock()
+
+
+def _export_pool() -> ThreadPoolExecutor:
+    """
+    Threads rather than processes: the app and API servers are
+    multi-threaded, which makes forking worker processes from them unsafe.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=EXPORT_WORKERS, thread_name_prefix="report-export")
+        return _pool
+
+
+# ---------- Helper: report content ----------
+def report_payload(
+    candidate_name: str,
+    role: str,
+    experience: str,
+    interview_type: str,
+    skills: str,
+    history: list,
+    summary: str,
+    created_at: float = None,
+) -> dict:
+    """
+    Everything an exported report shows, as plain JSON-safe data. history is
+    a list of HistoryItem or of interview_store.get_interview() item dicts.
+    """
+    items = [item if isinstance(item, HistoryItem) else HistoryItem.from_dict(item) for item in history]
+    scores = [item.score for item in items if item.score >= 0]
+    return {
+        "candidate_name": candidate_name,
+        "role": role,
+        "experience": experience,
+        "interview_type": interview_type,
+        "skills": skills,
+        "created_at": created_at,
+        "average_score": round(sum(scores) / len(scores), 2) if scores else None,
+        "questions": [
+            {
+                "question_no": item.question_no,
+                "question": item.question,
+                "answer": item.answer,
+                "skipped": item.skipped,
+                "score": item.score if item.score >= 0 else None,
+                "evaluation": item.evaluation,
+                **item.sections,
+            }
+            for item in items
+        ],
+        "summary": summary,
+    }
+
+
+def content_hash(payload: dict) -> str:
+    data = json.dumps([EXPORT_LAYOUT_VERSION, payload], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def export_filename(payload: dict, fmt: str) -> str:
+    """
+    e.g. interview_jane-doe_data-analyst_3f2a9c1b.pdf
+    """
+    parts = [payload["candidate_name"], payload["role"]]
+    slug = "_".join(re.sub(r"[^a-z0-9]+", "-", part.lower()).strip("-") or "unknown" for part in parts)
+    return f"interview_{slug}_{content_hash(payload)[:8]}.{fmt}"
+
+
+# ---------- Helper: renderers ----------
+def render_json(payload: dict) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+# The PDF core fonts only cover Latin-1
+_PDF_TRANSLATION = str.maketrans({
+    "–": "-", "—": "-", "‘": "'", "’": "'", "“": '"', "”": '"',
+    "•": "-", "…": "...", "→": "->", "✓": "v", "\u00a0": " ",
+})
+
+
+def _pdf_text(text: str) -> str:
+    """
+    Latin-1 plain text: markdown bold / heading marks dropped, typographic
+    characters replaced and anything else outside Latin-1 turned into '?'.
+    """
+    text = re.sub(r"^\s*#+\s*", "", text or "", flags=re.MULTILINE).replace("**", "")
+    return text.translate(_PDF_TRANSLATION).encode("latin-1", "replace").decode("latin-1")
+
+
+def render_pdf(payload: dict) -> bytes:
+    from fpdf import FPDF  # imported here so JSON-only use does not need fpdf2
+
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_page()
+
+    def heading(text: str, size: int = 13) -> None:
+        pdf.set_font("Helvetica", "B", size)
+        pdf.multi_cell(0, size * 0.55, _pdf_text(text), new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(1)
+
+    def paragraph(text: str, style: str = "") -> None:
+        pdf.set_font("Helvetica", style, 10)
+        pdf.multi_cell(0, 5, _pdf_text(text), new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(2)
+
+    heading("Interview Report", 18)
+    created = ""
+    if payload["created_at"]:
+        created = datetime.datetime.fromtimestamp(payload["created_at"]).strftime("%Y-%m-%d %H:%M")
+    average = payload["average_score"]
+    paragraph(
+        "\n".join(
+            line
+            for line in (
+                f"Candidate: {payload['candidate_name']}",
+                f"Role: {payload['role']} ({payload['experience']}, {payload['interview_type']})",
+                f"Key skills: {payload['skills']}",
+                f"Interview date: {created}" if created else "",
+                f"Average score: {average:.1f} / 10" if average is not None else "Average score: -",
+            )
+            if line
+        )
+    )
+
+    heading("Question-wise Scores")
+    pdf.set_font("Helvetica", size=10)
+    with pdf.table(col_widths=(12, 70, 18), text_align=("CENTER", "LEFT", "CENTER")) as table:
+        table.row(("Q No", "Question", "Score"))
+        for q in payload["questions"]:
+            score = "Skipped" if q["skipped"] else (f"{q['score']} / 10" if q["score"] is not None else "-")
+            table.row((str(q["question_no"]), _pdf_text(q["question"]), score))
+    pdf.ln(4)
+
+    heading("Final Interview Report")
+    paragraph(payload["summary"])
+
+    heading("Answers and Evaluations")
+    for q in payload["questions"]:
+        heading(f"Q{q['question_no']}. {q['question']}", 11)
+        paragraph(f"Answer: {q['answer']}", "I")
+        if any(q[name] for name in SECTIONS):
+            for name in SECTIONS:
+                if q[name]:
+                    paragraph(f"{name.replace('_', ' ').capitalize()}:\n{q[name]}")
+        elif q["evaluation"]:
+            paragraph(q["evaluation"])
+    return bytes(pdf.output())
+
+
+RENDERERS = {"pdf": render_pdf, "json": render_json}
+
+
+# ---------- Helper: content-hash cache ----------
+def _cache_path(key: str, fmt: str, cache_dir: str) -> str:
+    return os.path.join(cache_dir, f"{key}.{fmt}")
+
+
+def _cache_get(key: str, fmt: str, cache_dir: str):
+    if not cache_dir:
+        return None
+    path = _cache_path(key, fmt, cache_dir)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        os.utime(path)  # recently used files are evicted last
+        return data
+    except OSError:
+        return None
+
+
+def _cache_put(key: str, fmt: str, data: bytes, cache_dir: str) -> None:
+    if not cache_dir:
+        return
+    os.makedirs(cache_dir, exist_ok=True)
+    path = _cache_path(key, fmt, cache_dir)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    _evict(cache_dir)
+
+
+def _evict(cache_dir: str, max_files: int = EXPORT_CACHE_MAX_FILES) -> None:
+    """
+    Past max_files, removes the least recently used files down to 90% of it.
+    """
+    names = os.listdir(cache_dir)
+    if len(names) <= max_files:
+        return
+    entries = []
+    for name in names:
+        try:
+            entries.append((os.stat(os.path.join(cache_dir, name)).st_mtime, name))
+        except OSError:
+            pass
+    entries.sort()
+    for _, name in entries[: len(entries) - int(max_files * 0.9)]:
+        try:
+            os.remove(os.path.join(cache_dir, name))
+        except OSError:
+            pass  # removed by another worker
+
+
+def export_report(payload: dict, fmt: str, cache_dir: str = EXPORT_CACHE_DIR) -> bytes:
+    """
+    The report in one format, from the cache or freshly rendered (and cached).
+    Runs in the calling thread; start_export() is the non-blocking variant.
+    """
+    key = content_hash(payload)
+    data = _cache_get(key, fmt, cache_dir)
+    if data is None:
+        data = RENDERERS[fmt](payload)
+        _cache_put(key, fmt, data, cache_dir)
+    return data
+
+
+# ---------- Helper: background export ----------
+def start_export(payload: dict, formats=("pdf", "json"), pool: Executor = None) -> dict:
+    """
+    Returns {format: Future of bytes} without waiting. Cached formats come
+    back as already finished futures, and a format already being rendered
+    for the same content shares that render.
+    """
+    key = content_hash(payload)
+    futures = {}
+    for fmt in formats:
+        data = _cache_get(key, fmt, EXPORT_CACHE_DIR)
+        if data is not None:
+            futures[fmt] = Future()
+            futures[fmt].set_result(data)
+            continue
+        with _in_flight_lock:
+            future = _in_flight.get((key, fmt))
+            if future is None:
+                future = (pool or _export_pool()).submit(export_report, payload, fmt, EXPORT_CACHE_DIR)
+                _in_flight[(key, fmt)] = future
+                future.add_done_callback(lambda _, k=(key, fmt): _discard_in_flight(k))
+        futures[fmt] = future
+    return futures
+
+
+def _discard_in_flight(key: tuple) -> None:
+    with _in_flight_lock:
+        _in_flight.pop(key, None)
+
+
+# ---------- Bulk export of stored interviews ----------
+def stored_payload(interview: dict) -> dict:
+    """
+    report_payload() for an interview_store.get_interview() record.
+    """
+    return report_payload(
+        candidate_name=interview["candidate_name"],
+        role=interview["role"],
+        experience=interview["experience"],
+        interview_type=interview["interview_type"],
+        skills=interview["skills"],
+        history=interview["history"],
+        summary=interview["summary"] or "",
+        created_at=interview["created_at"],
+    )
+
+
+def export_interviews(store, interview_ids, out_dir: str, formats=("pdf",), workers: int = EXPORT_WORKERS):
+    """
+    Exports stored interviews into out_dir, rendering up to `workers` at a
+    time, and yields (interview_id, path, error) as each file is done; error
+    is None once the file is written, or the exception that failed its
+    render. At most 2 x workers interviews are loaded at once.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    ids = iter(interview_ids)
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as pool:
+        pending = {}  # future -> [(interview_id, path), ...]; identical reports share a render
+
+        def submit_next() -> bool:
+            for interview_id in ids:
+                interview = store.get_interview(interview_id)
+                if interview is None:
+                    continue
+                payload = stored_payload(interview)
+                for fmt, future in start_export(payload, formats, pool=pool).items():
+                    name = f"{interview_id}_{export_filename(payload, fmt)}"
+                    pending.setdefault(future, []).append((interview_id, os.path.join(out_dir, name)))
+                return True
+            return False
+
+        while len(pending) < workers * 2 and submit_next():
+            pass
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                try:
+                    data, error = future.result(), None
+                except Exception as e:
+                    data, error = None, e
+                for interview_id, path in pending.pop(future):
+                    if error is None:
+                        with open(path, "wb") as f:
+                            f.write(data)
+                    yield interview_id, path, error
+                    submit_next()
+
+
+def _date(value: str) -> float:
+    return datetime.datetime.strptime(value, "%Y-%m-%d").timestamp()
+
+
+def main(argv=None) -> int:
+    from interview_store import get_store
+
+    parser = argparse.ArgumentParser(description="Export stored interview reports as PDF / JSON.")
+    parser.add_argument("out_dir", help="directory the reports are written to")
+    parser.add_argument("--ids", type=int, nargs="+", help="interview ids (default: every match of the filters)")
+    parser.add_argument("--role", help="only this job role")
+    parser.add_argument("--since", type=_date, help="only interviews on or after this date (YYYY-MM-DD)")
+    parser.add_argument("--until", type=_date, help="only interviews before this date (YYYY-MM-DD)")
+    parser.add_argument("--min-score", type=float, help="only interviews with at least this average score")
+    parser.add_argument("--format", nargs="+", choices=sorted(RENDERERS), default=["pdf"])
+    parser.add_argument("--workers", type=int, default=EXPORT_WORKERS, help="reports rendered at the same time")
+    args = parser.parse_args(argv)
+
+    store = get_store()
+    if store is None:
+        print("The interview store is disabled; set INTERVIEW_STORE_PATH.", file=sys.stderr)
+        return 1
+
+    ids = args.ids
+    if ids is None:
+        ids, page = [], 1
+        while True:
+            rows, total = store.list_interviews(
+                role=args.role,
+                date_from=args.since,
+                date_to=args.until,
+                min_score=args.min_score,
+                page=page,
+                page_size=500,
+            )
+            ids += [row["id"] for row in rows]
+            if not rows or len(ids) >= total:
+                break
+            page += 1
+
+    written = failed = 0
+    for interview_id, path, error in export_interviews(store, ids, args.out_dir, args.format, args.workers):
+        if error is not None:
+            failed += 1
+            print(f"[{interview_id}] {os.path.basename(path)} failed: {error}", file=sys.stderr)
+            continue
+        written += 1
+        if written % 100 == 0:
+            print(f"{written} files written", file=sys.stderr)
+    print(f"Done: {written} files for {len(ids)} interviews in {args.out_dir}, {failed} failed", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+import contextvars
+import hashlib
+import io
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PyPDF2 import PdfReader
+
+from interview import extract_skills_from_resume
+from llm import response_cache
+from skills import SKILLS_LOCAL_MIN, match_skills_local
+
+# ---------- Config ----------
+# PDFs with more pages than this are split across worker threads
+RESUME_PARALLEL_PAGES = int(os.getenv("RESUME_PARALLEL_PAGES", "8"))
+RESUME_WORKERS = int(os.getenv("RESUME_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Resume text sent to the model per request, and the most requests per resume
+RESUME_CHUNK_CHARS = int(os.getenv("RESUME_CHUNK_CHARS", "12000"))
+RESUME_MAX_CHUNKS = int(os.getenv("RESUME_MAX_CHUNKS", "3"))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _extract_pool() -> ThreadPoolExecutor:
+    """
+    Threads rather than processes: the app and API servers are
+    multi-threaded, which makes forking worker processes from them unsafe.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=RESUME_WORKERS, thread_name_prefix="resume-pdf")
+        return _pool
+
+
+# ---------- Helper: PDF / text extraction ----------
+def _extract_pages(data: bytes, start: int, stop: int) -> list:
+    """
+    Extracts pages [start, stop) of a PDF. Runs on a worker thread.
+    """
+    reader = PdfReader(io.BytesIO(data))
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def extract_pdf_text(data: bytes) -> str:
+    """
+    Extracts the text of every page. Small PDFs are read directly; larger
+    ones are split into page ranges extracted on worker threads.
+    """
+    reader = PdfReader(io.BytesIO(data))
+    page_count = len(reader.pages)
+    if page_count <= RESUME_PARALLEL_PAGES or RESUME_WORKERS <= 1:
+        pages = [page.extract_text() or "" for page in reader.pages]
+    else:
+        step = -(-page_count // RESUME_WORKERS)
+        ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+        pool = _extract_pool()
+        futures = [pool.submit(_extract_pages, data, start, stop) for start, stop in ranges]
+        pages = [text for future in futures for text in future.result()]
+    return "\n".join(pages)
+
+
+def normalize_text(text: str) -> str:
+    """
+    Drops control characters, collapses runs of spaces and blank lines, and
+    trims every line.
+    """
+    text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", text)  # keeps \t, \n and \r
+    text = re.sub(r"[^\S\n]+", " ", text)
+    lines = [line.strip() for line in text.splitlines()]
+    text = "\n".join(lines)
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+
+def chunk_text(text: str, max_chars: int = RESUME_CHUNK_CHARS, max_chunks: int = RESUME_MAX_CHUNKS) -> list:
+    """
+    Splits text into at most max_chunks pieces of up to max_chars, breaking
+    on paragraph boundaries where possible. Anything past the last chunk is
+    dropped.
+    """
+    chunks = []
+    while text and len(chunks) < max_chunks:
+        if len(text) <= max_chars:
+            chunks.append(text)
+            break
+        cut = text.rfind("\n\n", 0, max_chars)
+        if cut <= 0:
+            cut = text.rfind("\n", 0, max_chars)
+        if cut <= 0:
+            cut = max_chars
+        chunks.append(text[:cut].strip())
+        text = text[cut:].strip()
+    return chunks
+
+
+def merge_skill_lists(skill_lists: list) -> str:
+    """
+    Joins several comma-separated skill lists, dropping case-insensitive
+    duplicates and keeping first-seen order.
+    """
+    seen = set()
+    merged = []
+    for skills_text in skill_lists:
+        for skill in skills_text.split(","):
+            skill = skill.strip()
+            if skill and skill.lower() not in seen:
+                seen.add(skill.lower())
+                merged.append(skill)
+    return ", ".join(merged)
+
+
+# ---------- Helper: resume -> skills ----------
+def resume_text(data: bytes, filename: str) -> str:
+    """
+    Returns the normalized text of a PDF or .txt resume, cached by content hash.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    key = f"resume-text:{digest}"
+    if response_cache is not None:
+        cached = response_cache.get(key)
+        if cached is not None:
+            return cached
+
+    if filename.lower().endswith(".pdf"):
+        text = extract_pdf_text(data)
+    else:  # assume .txt file
+        text = data.decode("utf-8", errors="ignore")
+    text = normalize_text(text)
+
+    if response_cache is not None and text:
+        response_cache.set(key, text)
+    return text
+
+
+def resume_skills(data: bytes, filename: str) -> str:
+    """
+    Extracts a comma-separated skill list from an uploaded resume. Skills are
+    matched against the local taxonomy first; only when fewer than
+    SKILLS_LOCAL_MIN unambiguous ones are found is the model asked, and its
+    answer merged with the local matches. Long resumes are chunked and the chunks sent to the
+    model concurrently. Results are cached by file content hash, so
+    re-uploading is free.
+    Raises LLMError if the model call fails.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    key = f"resume-skills:{digest}"
+    if response_cache is not None:
+        cached = response_cache.get(key)
+        if cached is not None:
+            return cached
+
+    text = resume_text(data, filename)
+    if not text:
+        return ""
+    matches = match_skills_local(text)
+    local_skills = [skill for skill, _ in matches]
+    if sum(confident for _, confident in matches) >= SKILLS_LOCAL_MIN:
+        skills = ", ".join(local_skills)
+    else:
+        chunks = chunk_text(text)
+        with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            futures = [
+                pool.submit(contextvars.copy_context().run, extract_skills_from_resume, chunk)
+                for chunk in chunks
+            ]
+            skills = merge_skill_lists(
+                [", ".join(local_skills), *(future.result() for future in futures)]
+            )
+
+    if response_cache is not None and skills:
+        response_cache.set(key, skills)
+    return skills
@@ -0,0 +1,180 @@
+"""
+Pluggable store for interview session state, so several app / API worker
+processes can share interviews and a restart does not lose them.
+
+SESSION_BACKEND=memory (default) keeps state in this process only;
+SESSION_BACKEND=sqlite shares it through SESSION_STORE_PATH (WAL mode, safe
+for many processes on one host).
+
+Every save carries the version it was based on (optimistic concurrency):
+if another worker saved the session in the meantime the write is refused
+with StaleSessionError instead of silently overwriting it.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+# ---------- Config ----------
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "memory")  # "memory" or "sqlite"
+SESSION_STORE_PATH = os.getenv("SESSION_STORE_PATH", ".sessions.sqlite3")
+SESSION_TTL_SECONDS = float(os.getenv("SESSION_TTL_SECONDS", "86400"))
+
+
+class StaleSessionError(Exception):
+    """
+    The session was saved by someone else since it was loaded.
+    """
+
+
+def dumps(state: dict) -> bytes:
+    """
+    Compact serialization: minified JSON, zlib-compressed.
+    """
+    return zlib.compress(
+        json.dumps(state, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    )
+
+
+def loads(data: bytes) -> dict:
+    return json.loads(zlib.decompress(data).decode("utf-8"))
+
+
+class MemorySessionBackend:
+    """
+    Sessions held in this process; the same interface as the shared backend.
+    """
+
+    def __init__(self, ttl_seconds: float = SESSION_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._sessions = {}  # session_id -> (version, data, updated_at)
+
+    def load(self, session_id: str) -> tuple:
+        """
+        Returns (state, version); (None, 0) for an unknown or expired session.
+        """
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None or time.time() - entry[2] > self.ttl_seconds:
+                self._sessions.pop(session_id, None)
+                return None, 0
+            return loads(entry[1]), entry[0]
+
+    def save(self, session_id: str, state: dict, version: int) -> int:
+        """
+        Stores state if the session is still at `version` (0 = new) and
+        returns the new version; raises StaleSessionError otherwise.
+        """
+        data = dumps(state)
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            current = entry[0] if entry is not None else 0
+            if current != version:
+                raise StaleSessionError(f"session {session_id} is at version {current}, not {version}")
+            self._sessions[session_id] = (version + 1, data, time.time())
+            self._expire()
+            return version + 1
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def _expire(self) -> None:
+        cutoff = time.time() - self.ttl_seconds
+        for session_id in [k for k, e in self._sessions.items() if e[2] < cutoff]:
+            del self._sessions[session_id]
+
+
+class SQLiteSessionBackend:
+    """
+    Sessions in a SQLite file shared by every worker process on the host.
+    """
+
+    def __init__(self, path: str = SESSION_STORE_PATH, ttl_seconds: float = SESSION_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                version INTEGER NOT NULL,
+                data BLOB NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS sessions_updated_at ON sessions (updated_at)"
+        )
+        self._conn.commit()
+
+    def load(self, session_id: str) -> tuple:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, data FROM sessions WHERE session_id = ? AND updated_at >= ?",
+                (session_id, time.time() - self.ttl_seconds),
+            ).fetchone()
+        if row is None:
+            return None, 0
+        return loads(row[1]), row[0]
+
+    def save(self, session_id: str, state: dict, version: int) -> int:
+        data = dumps(state)
+        now = time.time()
+        with self._lock, self._conn:
+            if version == 0:
+                # A new session may replace an expired one, never a live one
+                cursor = self._conn.execute(
+                    "INSERT INTO sessions (session_id, version, data, updated_at) VALUES (?, 1, ?, ?) "
+                    "ON CONFLICT (session_id) DO UPDATE SET version = 1, data = excluded.data, "
+                    "updated_at = excluded.updated_at WHERE sessions.updated_at < ?",
+                    (session_id, data, now, now - self.ttl_seconds),
+                )
+            else:
+                cursor = self._conn.execute(
+                    "UPDATE sessions SET version = version + 1, data = ?, updated_at = ? "
+                    "WHERE session_id = ? AND version = ?",
+                    (data, now, session_id, version),
+                )
+            if cursor.rowcount != 1:
+                raise StaleSessionError(f"session {session_id} changed since version {version}")
+            self._conn.execute(
+                "DELETE FROM sessions WHERE updated_at < ?", (now - self.ttl_seconds,)
+            )
+        return version + 1
+
+    def delete(self, session_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+
+BACKENDS = {
+    "memory": MemorySessionBackend,
+    "sqlite": SQLiteSessionBackend,
+}
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """
+    The process-wide session backend chosen by SESSION_BACKEND.
+    """
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                try:
+                    _backend = BACKENDS[SESSION_BACKEND]()
+                except KeyError:
+                    raise ValueError(
+                        f"Unknown SESSION_BACKEND {SESSION_BACKEND!r}; use one of {', '.join(BACKENDS)}"
+                    ) from None
+    return _backend
@@ -0,0 +1,249 @@
+import json
+import os
+
+# ---------- Config ----------
+# Resumes with at least this many locally matched skills skip the model call;
+# skills matched only through ambiguous terms (see below) do not count
+SKILLS_LOCAL_MIN = int(os.getenv("SKILLS_LOCAL_MIN", "5"))
+# Optional JSON file {"Canonical name": ["alias", ...]} merged into SKILL_TAXONOMY
+SKILLS_TAXONOMY_PATH = os.getenv("SKILLS_TAXONOMY_PATH", "")
+
+# ---------- Skill taxonomy: canonical name -> aliases ----------
+SKILL_TAXONOMY = {
+    # Languages
+    "Python": ["python3"],
+    "Java": [],
+    "JavaScript": ["js", "ecmascript", "es6"],
+    "TypeScript": [],
+    "C": [],
+    "C++": ["cpp", "c plus plus"],
+    "C#": ["c sharp", "csharp"],
+    "Golang": ["go lang"],
+    "Rust": [],
+    "Kotlin": [],
+    "Swift": [],
+    "Ruby": [],
+    "PHP": [],
+    "Scala": [],
+    "R": [],
+    "MATLAB": [],
+    "Dart": [],
+    "Bash": ["shell scripting", "shell script"],
+    "SQL": [],
+    "HTML": ["html5"],
+    "CSS": ["css3"],
+    # Web frameworks
+    "Django": [],
+    "Flask": [],
+    "FastAPI": ["fast api"],
+    "Streamlit": [],
+    "Spring Boot": ["springboot", "spring framework"],
+    "Node.js": ["nodejs", "node js"],
+    "Express.js": ["expressjs"],
+    "React": ["react.js", "reactjs"],
+    "Angular": ["angularjs", "angular.js"],
+    "Vue.js": ["vue", "vuejs"],
+    "Next.js": ["nextjs"],
+    "Tailwind CSS": ["tailwind", "tailwindcss"],
+    "Bootstrap": [],
+    ".NET": ["dotnet", "asp.net", ".net core"],
+    "REST APIs": ["rest api", "restful", "restful apis"],
+    "GraphQL": [],
+    # Data & ML
+    "Pandas": [],
+    "NumPy": ["numpy"],
+    "SciPy": [],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "TensorFlow": ["tensorflow"],
+    "Keras": [],
+    "PyTorch": ["torch"],
+    "Machine Learning": ["ml"],
+    "Deep Learning": [],
+    "Natural Language Processing": ["nlp"],
+    "Computer Vision": ["opencv"],
+    "Large Language Models": ["llm", "llms"],
+    "LangChain": [],
+    "Data Analysis": ["data analytics"],
+    "Data Visualization": ["matplotlib", "seaborn", "plotly"],
+    "Power BI": ["powerbi"],
+    "Tableau": [],
+    "Excel": ["ms excel", "microsoft excel"],
+    "Apache Spark": ["spark", "pyspark"],
+    "Hadoop": [],
+    "Airflow": ["apache airflow"],
+    "Kafka": ["apache kafka"],
+    "ETL": [],
+    # Databases
+    "MySQL": [],
+    "PostgreSQL": ["postgres", "postgresql"],
+    "SQLite": [],
+    "MongoDB": ["mongo"],
+    "Redis": [],
+    "Oracle": ["oracle db"],
+    "Elasticsearch": ["elastic search"],
+    "Firebase": [],
+    # Cloud & DevOps
+    "AWS": ["amazon web services"],
+    "Azure": ["microsoft azure"],
+    "Google Cloud": ["gcp", "google cloud platform"],
+    "Docker": [],
+    "Kubernetes": ["k8s"],
+    "Terraform": [],
+    "Jenkins": [],
+    "CI/CD": ["ci cd", "continuous integration"],
+    "GitHub Actions": [],
+    "Linux": ["unix"],
+    "Git": ["github", "gitlab", "version control"],
+    "Microservices": ["microservice"],
+    # Mobile
+    "Android": [],
+    "iOS": [],
+    "Flutter": [],
+    "React Native": [],
+    # CS fundamentals & practices
+    "Data Structures": ["data structure"],
+    "Algorithms": ["algorithm", "dsa"],
+    "OOP": ["object oriented programming", "object-oriented programming", "oops"],
+    "System Design": [],
+    "Operating Systems": [],
+    "Computer Networks": ["networking"],
+    "DBMS": ["database management"],
+    "Unit Testing": ["pytest", "junit", "unittest"],
+    "Agile": ["scrum"],
+    "JIRA": [],
+    "Selenium": [],
+    "Figma": [],
+    # Professional skills
+    "Communication": ["communication skills"],
+    "Leadership": ["team leadership"],
+    "Teamwork": ["team player", "collaboration"],
+    "Problem Solving": ["problem-solving"],
+    "Project Management": [],
+    "Time Management": [],
+}
+
+
+# Names and aliases that are also everyday words, or too short to be
+# reliable ("C", "R", "ml"). They are still reported, but do not count
+# toward SKILLS_LOCAL_MIN, so prose alone cannot skip the model call.
+AMBIGUOUS_MAX_LEN = 2
+AMBIGUOUS_SKILL_TERMS = {
+    "rust", "swift", "ruby", "dart", "java",
+    "react", "flask", "bootstrap", "torch",
+    "excel", "spark", "oracle", "jenkins", "networking",
+    "agile", "scrum",
+    "communication", "communication skills", "leadership", "team leadership",
+    "teamwork", "team player", "collaboration", "problem solving", "problem-solving",
+    "project management", "time management",
+}
+
+
+def _is_ambiguous(term: str) -> bool:
+    return len(term) <= AMBIGUOUS_MAX_LEN or term in AMBIGUOUS_SKILL_TERMS
+
+
+def _load_taxonomy() -> dict:
+    taxonomy = {name: list(aliases) for name, aliases in SKILL_TAXONOMY.items()}
+    if SKILLS_TAXONOMY_PATH:
+        with open(SKILLS_TAXONOMY_PATH, encoding="utf-8") as f:
+            for name, aliases in json.load(f).items():
+                taxonomy.setdefault(name, []).extend(aliases)
+    return taxonomy
+
+
+# ---------- Aho-Corasick matcher ----------
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over every skill name and alias (case-insensitive).
+    scan() goes over text once and returns (canonical name, confident) in
+    order of first appearance, matching whole words only and preferring the
+    longest match where aliases overlap (e.g. "C++" over "C"). A skill is
+    confident when at least one of its matches is not an ambiguous term.
+    """
+
+    def __init__(self, taxonomy: dict):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for canonical, aliases in taxonomy.items():
+            for alias in {canonical, *aliases}:
+                term = alias.lower()
+                self._add(term, (canonical, not _is_ambiguous(term)))
+        self._build()
+
+    def _add(self, pattern: str, skill: tuple) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((len(pattern), skill))
+
+    def _build(self) -> None:
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def scan(self, text: str) -> list:
+        text = text.lower()
+        matches = []
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            for length, skill in self._out[state]:
+                start = i - length + 1
+                if start > 0 and text[start - 1].isalnum() and text[start].isalnum():
+                    continue
+                if i + 1 < len(text) and text[i + 1].isalnum() and text[i].isalnum():
+                    continue
+                matches.append((start, -length, skill))
+
+        # Leftmost-longest, non-overlapping
+        found = {}  # canonical -> confident, in order of first appearance
+        end = 0
+        for start, neg_length, (canonical, confident) in sorted(matches):
+            if start < end:
+                continue
+            end = start - neg_length
+            found[canonical] = found.get(canonical, False) or confident
+        return list(found.items())
+
+    def find(self, text: str) -> list:
+        return [canonical for canonical, _ in self.scan(text)]
+
+
+_matcher = None
+
+
+def _get_matcher() -> SkillMatcher:
+    global _matcher
+    if _matcher is None:
+        _matcher = SkillMatcher(_load_taxonomy())
+    return _matcher
+
+
+def extract_skills_local(text: str) -> list:
+    """
+    Returns canonical skill names found in text without calling the model.
+    """
+    return _get_matcher().find(text)
+
+
+def match_skills_local(text: str) -> list:
+    """
+    Like extract_skills_local(), as (canonical name, confident) pairs.
+    """
+    return _get_matcher().scan(text)
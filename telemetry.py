@@ -0,0 +1,213 @@
+import bisect
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# ---------- Config ----------
+# Optional file every call record is appended to as one JSON line
+TELEMETRY_LOG_PATH = os.getenv("LLM_TELEMETRY_LOG", "")
+TELEMETRY_RECENT = int(os.getenv("LLM_TELEMETRY_RECENT", "500"))
+
+# Histogram bucket upper bounds in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0)
+
+# Interview session the current model calls belong to. Thread pools that run
+# model calls should submit via contextvars.copy_context().run to keep it.
+current_session = contextvars.ContextVar("llm_session", default="")
+
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last = +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Upper bound of the bucket holding the q-th quantile (inf if beyond the last).
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class Telemetry:
+    """
+    Aggregates one record per model call, grouped by purpose (skills,
+    question, evaluation, summary, ...).
+    """
+
+    def __init__(self, log_path: str = TELEMETRY_LOG_PATH, recent: int = TELEMETRY_RECENT):
+        self.log_path = log_path
+        self.recent = deque(maxlen=recent)
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def _purpose_stats(self, purpose: str) -> dict:
+        stats = self._stats.get(purpose)
+        if stats is None:
+            stats = self._stats[purpose] = {
+                "calls": 0,
+                "errors": {},
+                "retries": 0,
+                "cache_hits": 0,
+                "coalesced": 0,
+                "hedged": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "wall_time": Histogram(),
+                "queue_time": Histogram(),
+            }
+        return stats
+
+    def record(
+        self,
+        purpose: str,
+        model: str,
+        wall_time: float,
+        queue_time: float = 0.0,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        retries: int = 0,
+        cache_hit: bool = False,
+        error: str = "",
+        coalesced: bool = False,
+        hedged: bool = False,
+    ) -> None:
+        entry = {
+            "ts": time.time(),
+            "purpose": purpose,
+            "session": current_session.get(),
+            "model": model,
+            "wall_time": round(wall_time, 4),
+            "queue_time": round(queue_time, 4),
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "retries": retries,
+            "cache_hit": cache_hit,
+            "coalesced": coalesced,
+            "hedged": hedged,
+            "error": error,
+        }
+        with self._lock:
+            stats = self._purpose_stats(purpose)
+            stats["calls"] += 1
+            stats["retries"] += retries
+            stats["cache_hits"] += int(cache_hit)
+            stats["coalesced"] += int(coalesced)
+            stats["hedged"] += int(hedged)
+            stats["prompt_tokens"] += prompt_tokens
+            stats["completion_tokens"] += completion_tokens
+            if error:
+                stats["errors"][error] = stats["errors"].get(error, 0) + 1
+            stats["wall_time"].observe(wall_time)
+            stats["queue_time"].observe(queue_time)
+            self.recent.append(entry)
+            if self.log_path:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry) + "\n")
+
+    def summary_rows(self) -> list:
+        """
+        One row per purpose for display (e.g. in a DataFrame).
+        """
+        with self._lock:
+            rows = []
+            for purpose, stats in sorted(self._stats.items()):
+                calls = stats["calls"]
+                rows.append(
+                    {
+                        "Purpose": purpose,
+                        "Calls": calls,
+                        "p50 s": stats["wall_time"].quantile(0.5),
+                        "p95 s": stats["wall_time"].quantile(0.95),
+                        "p95 queue s": stats["queue_time"].quantile(0.95),
+                        "Prompt tok": stats["prompt_tokens"],
+                        "Completion tok": stats["completion_tokens"],
+                        "Cache hit %": round(100 * stats["cache_hits"] / calls, 1) if calls else 0.0,
+                        "Coalesced": stats["coalesced"],
+                        "Hedged": stats["hedged"],
+                        "Errors": sum(stats["errors"].values()),
+                        "Retries": stats["retries"],
+                    }
+                )
+            return rows
+
+    def prometheus_text(self) -> str:
+        """
+        All metrics in the Prometheus text exposition format.
+        """
+        families = {
+            "llm_calls_total": ("counter", []),
+            "llm_cache_hits_total": ("counter", []),
+            "llm_coalesced_total": ("counter", []),
+            "llm_hedged_total": ("counter", []),
+            "llm_retries_total": ("counter", []),
+            "llm_tokens_total": ("counter", []),
+            "llm_errors_total": ("counter", []),
+            "llm_call_seconds": ("histogram", []),
+            "llm_queue_seconds": ("histogram", []),
+        }
+        with self._lock:
+            for purpose, stats in sorted(self._stats.items()):
+                label = f'purpose="{purpose}"'
+                families["llm_calls_total"][1].append(f"llm_calls_total{{{label}}} {stats['calls']}")
+                families["llm_cache_hits_total"][1].append(
+                    f"llm_cache_hits_total{{{label}}} {stats['cache_hits']}"
+                )
+                families["llm_coalesced_total"][1].append(
+                    f"llm_coalesced_total{{{label}}} {stats['coalesced']}"
+                )
+                families["llm_hedged_total"][1].append(
+                    f"llm_hedged_total{{{label}}} {stats['hedged']}"
+                )
+                families["llm_retries_total"][1].append(f"llm_retries_total{{{label}}} {stats['retries']}")
+                for kind in ("prompt", "completion"):
+                    families["llm_tokens_total"][1].append(
+                        f'llm_tokens_total{{{label},kind="{kind}"}} {stats[kind + "_tokens"]}'
+                    )
+                for error, count in sorted(stats["errors"].items()):
+                    families["llm_errors_total"][1].append(
+                        f'llm_errors_total{{{label},error="{error}"}} {count}'
+                    )
+                for name, key in (("llm_call_seconds", "wall_time"), ("llm_queue_seconds", "queue_time")):
+                    hist = stats[key]
+                    samples = families[name][1]
+                    cumulative = 0
+                    for bound, count in zip(hist.buckets, hist.counts):
+                        cumulative += count
+                        samples.append(f'{name}_bucket{{{label},le="{bound}"}} {cumulative}')
+                    samples.append(f'{name}_bucket{{{label},le="+Inf"}} {hist.count}')
+                    samples.append(f"{name}_sum{{{label}}} {hist.total:.6f}")
+                    samples.append(f"{name}_count{{{label}}} {hist.count}")
+
+        lines = []
+        for name, (kind, samples) in families.items():
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    def jsonl(self) -> str:
+        """
+        The most recent call records as JSON lines.
+        """
+        with self._lock:
+            return "".join(json.dumps(entry) + "\n" for entry in self.recent)
+
+
+telemetry = Telemetry()